@@ -13,23 +13,19 @@ Requirements:
 """
 
 import argparse
+import importlib.util
 import logging
 import sys
 from pathlib import Path
 
-# Add project root to path for imports
+# Add project root to path for imports, unless specify is already importable
+# (e.g. after `pip install -e .`); an extra sys.path entry costs a stat probe
+# for every later import
 PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if importlib.util.find_spec("specify") is None:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
-# Load environment variables from .env
-from dotenv import load_dotenv
-
-load_dotenv(PROJECT_ROOT / ".env")
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+# Handlers are configured in the __main__ block, after argument parsing
 logger = logging.getLogger(__name__)
 
 
@@ -64,6 +60,11 @@ def main(input_path: str, output_path: str = None) -> dict:
         FileNotFoundError: If input file doesn't exist
         ValueError: If input data is invalid
     """
+    # Load environment variables from .env
+    from dotenv import load_dotenv
+
+    load_dotenv(PROJECT_ROOT / ".env")
+
     # Set default output path
     if output_path is None:
         output_path = PROJECT_ROOT / ".tmp" / "output"
@@ -73,8 +74,8 @@ def main(input_path: str, output_path: str = None) -> dict:
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    logger.info(f"Processing input: {input_path}")
-    logger.info(f"Output will be saved to: {output_path}")
+    logger.info("Processing input: %s", input_path)
+    logger.info("Output will be saved to: %s", output_path)
 
     # Validate input
     input_path = Path(input_path)
@@ -93,19 +94,22 @@ def main(input_path: str, output_path: str = None) -> dict:
     # with open(output_path, 'w') as f:
     #     json.dump(result, f, indent=2)
 
-    logger.info(f"Processing complete: {result['status']}")
+    logger.info("Processing complete: %s", result["status"])
     return result
 
 
 if __name__ == "__main__":
     args = parse_args()
 
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    # Configure logging
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
 
     try:
         result = main(input_path=args.input, output_path=args.output)
         print(f"Done: {result['status']}")
     except Exception as e:
-        logger.error(f"Execution failed: {e}")
+        logger.error("Execution failed: %s", e)
         sys.exit(1)
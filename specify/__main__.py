@@ -0,0 +1,39 @@
+"""
+Module entry point for ``python -m specify``.
+
+``--version`` is answered directly, without importing Click or the CLI
+module; every other invocation is delegated to ``specify.cli.main``.
+
+Example usage:
+    $ python -m specify --version
+    specify-ai, version 0.1.0
+
+    $ python -m specify generate --prompt "Build a task app"
+"""
+
+from __future__ import annotations
+
+import sys
+
+
+def _fast_main() -> int:
+    """
+    Run the CLI, short-circuiting a bare ``--version`` request.
+
+    Returns:
+        Exit code (0 for success, non-zero for failure).
+    """
+    if sys.argv[1:] == ["--version"]:
+        from specify import __version__
+
+        # Same output as click.version_option on the ``specify`` group
+        print(f"specify-ai, version {__version__}")
+        return 0
+
+    from specify.cli import main
+
+    return main()
+
+
+if __name__ == "__main__":
+    sys.exit(_fast_main())
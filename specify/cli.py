@@ -9,6 +9,9 @@ It uses Click for command parsing and provides the following commands:
 - check-consistency: Check consistency between generated documents
 - fix-inconsistencies: Automatically fix inconsistencies in documents
 
+The subcommands live in ``specify.commands`` and are imported lazily by
+``LazyGroup`` when they are first resolved.
+
 Example usage:
     $ specify --version
     specify-ai, version 0.1.0
@@ -21,14 +24,18 @@ Example usage:
 
 from __future__ import annotations
 
+import importlib
 import sys
 from collections.abc import Sequence
+from typing import TYPE_CHECKING, ClassVar
 
 import click
-import requests
 
 from specify import __version__
-from specify.core import KeyManager, KeyNotFoundError, KeyValidationError
+from specify.commands import CliState
+
+if TYPE_CHECKING:
+    from specify.core import KeyManager
 
 
 # Default Ollama URL
@@ -87,6 +94,8 @@ def _check_first_run() -> bool:
     Returns:
         True if no keys are configured, False otherwise.
     """
+    from specify.core import KeyManager
+
     try:
         key_manager = KeyManager()
         keys = key_manager.list_keys()
@@ -139,7 +148,53 @@ def _should_skip_onboarding(ctx: click.Context) -> bool:
     return False
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """
+    Click group that imports subcommand modules on first use.
+
+    Subcommands listed in ``lazy_subcommands`` are resolved by importing
+    their module only when Click asks for them, so ``specify --version``
+    never imports the command modules (or the key manager and provider
+    dependencies they pull in).
+
+    Attributes:
+        lazy_subcommands: Mapping of command name to (module path, attribute).
+    """
+
+    lazy_subcommands: ClassVar[dict[str, tuple[str, str]]] = {
+        "generate": ("specify.commands.generate", "generate"),
+        "config": ("specify.commands.config", "config"),
+        "check-consistency": ("specify.commands.consistency", "check_consistency"),
+        "fix-inconsistencies": ("specify.commands.consistency", "fix_inconsistencies"),
+    }
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self._lazy_cache: dict[str, click.Command] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eagerly registered and lazy subcommand names, sorted."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolve a subcommand, importing its module if it is lazy."""
+        if cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
+
+        command = self._lazy_cache.get(cmd_name)
+        if command is None:
+            module_path, attr = self.lazy_subcommands[cmd_name]
+            command = getattr(importlib.import_module(module_path), attr)
+            if not isinstance(command, click.Command):
+                raise TypeError(
+                    f"Lazy subcommand '{cmd_name}' must be a click.Command, "
+                    f"got {type(command).__name__}"
+                )
+            self._lazy_cache[cmd_name] = command
+        return command
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version=__version__, prog_name="specify-ai")
 @click.option(
     "--verbose",
@@ -167,8 +222,7 @@ def cli(ctx: click.Context, verbose: bool) -> None:
         specify generate --help
         specify config --help
     """
-    ctx.ensure_object(dict)
-    ctx.obj["verbose"] = verbose
+    ctx.ensure_object(CliState).verbose = verbose
 
     # First-run detection: Check if onboarding should be triggered
     # Only trigger if no keys are configured AND no explicit subcommand/flags provided
@@ -436,6 +490,8 @@ def save_provider_config(provider: str, key: str, model: str) -> None:
         key: The API key or base URL.
         model: The selected model name.
     """
+    from specify.core import KeyManager, KeyValidationError
+
     try:
         key_manager = KeyManager()
         key_manager.store_key(provider, key)
@@ -594,6 +650,8 @@ def handle_generate_flow() -> None:
         doc_type = doc_types[type_choice - 1]
 
         # Provider selection
+        from specify.core import KeyManager
+
         key_manager = KeyManager()
         keys = key_manager.list_keys()
 
@@ -654,7 +712,7 @@ def handle_generate_flow() -> None:
                 self.obj = {"verbose": False}
 
         # Call the generate command directly
-        from specify.cli import generate
+        from specify.commands.generate import generate
 
         runner = CliRunner()
         result = runner.invoke(
@@ -703,6 +761,8 @@ def handle_list_providers() -> None:
     Displays all configured providers with their masked API keys
     and selected models.
     """
+    from specify.core import KeyManager
+
     key_manager = KeyManager()
     keys = key_manager.list_keys()
 
@@ -727,6 +787,8 @@ def handle_delete_provider() -> None:
     Shows a numbered list of providers and allows the user to select
     which one to delete.
     """
+    from specify.core import KeyManager
+
     key_manager = KeyManager()
     keys = key_manager.list_keys()
 
@@ -802,6 +864,8 @@ def fetch_ollama_models(base_url: str) -> list[str]:
     Raises:
         Exception: If the API call fails.
     """
+    import requests
+
     # Normalize URL (ensure no trailing slash)
     base_url = base_url.rstrip("/")
 
@@ -842,6 +906,8 @@ def fetch_openai_models(api_key: str) -> list[str]:
     Raises:
         Exception: If the API call fails.
     """
+    import requests
+
     try:
         headers = {
             "Authorization": f"Bearer {api_key}",
@@ -910,253 +976,10 @@ def fetch_anthropic_models(api_key: str) -> list[str]:
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Generate Command Group
-# ─────────────────────────────────────────────────────────────────────────────
-
-
-@cli.command()
-@click.option(
-    "--prompt",
-    "-p",
-    required=True,
-    help="Product description prompt for document generation.",
-)
-@click.option(
-    "--type",
-    "-t",
-    "doc_type",
-    type=click.Choice(
-        ["app-flow", "bdd", "design-doc", "prd", "tech-arch", "all"],
-        case_sensitive=False,
-    ),
-    default="all",
-    show_default=True,
-    help="Type of document to generate.",
-)
-@click.option(
-    "--provider",
-    type=click.Choice(["ollama", "openai", "anthropic"], case_sensitive=False),
-    default="ollama",
-    show_default=True,
-    help="LLM provider to use for generation.",
-)
-@click.option(
-    "--output",
-    "-o",
-    type=click.Path(file_okay=False, dir_okay=True, writable=True),
-    default="./output",
-    show_default=True,
-    help="Output directory for generated documents.",
-)
-@click.option(
-    "--model",
-    "-m",
-    default=None,
-    help="Specific model to use (provider-specific).",
-)
-@click.option(
-    "--no-recommendations",
-    is_flag=True,
-    help="Skip clarification questions for missing information.",
-)
-@click.option(
-    "--no-consistency-check",
-    is_flag=True,
-    help="Skip post-generation consistency check prompt.",
-)
-@click.option(
-    "--auto-fix",
-    is_flag=True,
-    help="Automatically fix inconsistencies without prompting.",
-)
-@click.pass_context
-def generate(
-    ctx: click.Context,
-    prompt: str,
-    doc_type: str,
-    provider: str,
-    output: str,
-    model: str | None,
-    no_recommendations: bool,
-    no_consistency_check: bool,
-    auto_fix: bool,
-) -> None:
-    """
-    Generate documentation from a product description prompt.
-
-    This command generates one or more documents based on the provided
-    prompt. Documents follow the rules defined in the plan/rules/ directory.
-
-    \b
-    Document Types:
-        - app-flow: App Flow Document (user flow specification)
-        - bdd: Backend Design Document
-        - design-doc: Design Document (design system specification)
-        - prd: Product Requirements Document
-        - tech-arch: Technical Architecture Document
-        - all: Generate all 5 documents
-
-    \b
-    Examples:
-        specify generate -p "Build a task app" -t all
-        specify generate -p "Build a task app" -t prd --provider openai
-        specify generate -p "Build a task app" -t all -o ./my-docs
-        specify generate -p "Build a task app" -t all --no-consistency-check
-        specify generate -p "Build a task app" -t all --auto-fix
-    """
-    verbose = ctx.obj.get("verbose", False)
-
-    if verbose:
-        click.echo(f"Generating {doc_type} document(s)...")
-        click.echo(f"Provider: {provider}")
-        click.echo(f"Output directory: {output}")
-
-    # TODO: Implement document generation (Sprint 2-3)
-    click.echo(
-        "[PLACEHOLDER] Document generation is not yet implemented. "
-        "This is a stub that will be fully implemented in Sprint 2-3."
-    )
-    click.echo(f"Would generate {doc_type} document(s) using {provider}.")
-    click.echo(
-        f"Prompt: {prompt[:100]}..." if len(prompt) > 100 else f"Prompt: {prompt}"
-    )
-
-    # Run consistency check loop after generation by default
-    # Skip if --no-consistency-check is provided
-    # If --auto-fix is provided, run consistency check with auto-fix enabled
-    if not no_consistency_check:
-        consistency_check_loop(output, auto_fix=auto_fix)
-
-
-# ─────────────────────────────────────────────────────────────────────────────
-# Config Command Group
+# Interactive Delete Functions
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@cli.group()
-def config() -> None:
-    """
-    Manage configuration and API keys.
-
-    Commands for storing, listing, and deleting API keys for
-    LLM providers (Ollama, OpenAI, Anthropic).
-
-    \b
-    Examples:
-        specify config set-key --provider ollama --key "your-key"
-        specify config list-keys
-        specify config delete-key --provider ollama
-    """
-    pass
-
-
-@config.command(name="set-key")
-@click.option(
-    "--provider",
-    "-p",
-    required=True,
-    type=click.Choice(["ollama", "openai", "anthropic"], case_sensitive=False),
-    help="LLM provider for the API key.",
-)
-@click.option(
-    "--key",
-    "-k",
-    required=True,
-    help="API key or URL (for Ollama).",
-)
-def set_key(provider: str, key: str) -> None:
-    """
-    Store an API key for a provider.
-
-    API keys are stored locally in the user's home directory.
-    For Ollama, the key can be the base URL of your Ollama instance.
-
-    \b
-    Examples:
-        specify config set-key --provider openai --key sk-xxx
-        specify config set-key --provider anthropic --key sk-ant-xxx
-        specify config set-key --provider ollama --key http://localhost:11434
-    """
-    try:
-        key_manager = KeyManager()
-        key_manager.store_key(provider, key)
-        click.echo(f"[OK] API key stored for {provider}")
-    except KeyValidationError as e:
-        raise click.ClickException(str(e)) from e
-
-
-@config.command(name="list-keys")
-def list_keys() -> None:
-    """
-    List all configured providers.
-
-    Shows which LLM providers have API keys configured.
-    Keys are displayed in masked format (e.g., sk-...abc).
-    Keys are sourced from both the local store and environment variables.
-
-    \b
-    Example:
-        specify config list-keys
-    """
-    key_manager = KeyManager()
-    keys = key_manager.list_keys()
-
-    if not keys:
-        click.echo("No API keys configured.")
-        return
-
-    # Print formatted output
-    click.echo("Configured API Keys:")
-    click.echo("-" * 40)
-    for provider, masked_key in keys.items():
-        click.echo(f"  {provider}: {masked_key}")
-
-
-@config.command(name="delete-key")
-@click.option(
-    "--provider",
-    "-p",
-    required=False,
-    type=click.Choice(["ollama", "openai", "anthropic"], case_sensitive=False),
-    help="Provider to delete the key for. If not specified, shows interactive selection.",
-)
-def delete_key(provider: str | None) -> None:
-    """
-    Delete a stored API key.
-
-    Removes the API key for the specified provider from local storage.
-    If --provider is not specified, shows an interactive list of
-    configured providers to select from.
-
-    Note: This does not affect environment variables.
-
-    \b
-    Examples:
-        specify config delete-key --provider openai
-        specify config delete-key
-    """
-    key_manager = KeyManager()
-    keys = key_manager.list_keys()
-
-    # If provider is specified, use non-interactive mode (backward compatibility)
-    if provider:
-        try:
-            key_manager.delete_key(provider)
-            click.echo(f"[OK] API key deleted for {provider}")
-        except KeyNotFoundError as e:
-            raise click.ClickException(str(e)) from e
-        return
-
-    # No provider specified - show interactive selection
-    # Check if any keys are configured
-    if not keys:
-        click.echo("No API keys configured.")
-        return
-
-    # Run interactive deletion
-    run_interactive_delete(key_manager, keys)
-
-
 def run_interactive_delete(key_manager: KeyManager, keys: dict[str, str]) -> None:
     """
     Run interactive provider selection for deletion.
@@ -1165,6 +988,8 @@ def run_interactive_delete(key_manager: KeyManager, keys: dict[str, str]) -> Non
         key_manager: KeyManager instance.
         keys: Dictionary of provider -> masked_key.
     """
+    from specify.core import KeyNotFoundError
+
     click.echo("\nConfigured API Keys:")
 
     # Create numbered list
@@ -1434,83 +1259,6 @@ def consistency_check_loop(output_dir: str, auto_fix: bool = False) -> None:
                 pass
 
 
-# ─────────────────────────────────────────────────────────────────────────────
-# Consistency Commands
-# ─────────────────────────────────────────────────────────────────────────────
-
-
-@cli.command(name="check-consistency")
-@click.option(
-    "--dir",
-    "-d",
-    "directory",
-    type=click.Path(file_okay=False, dir_okay=True),
-    default="./output",
-    show_default=True,
-    help="Directory containing generated documents.",
-)
-@click.pass_context
-def check_consistency(ctx: click.Context, directory: str) -> None:
-    """
-    Check consistency between generated documents.
-
-    Analyzes all generated documents in the specified directory
-    and reports any inconsistencies or conflicts.
-
-    \b
-    Example:
-        specify check-consistency --dir ./my-docs
-    """
-    verbose = ctx.obj.get("verbose", False)
-
-    if verbose:
-        click.echo(f"Checking consistency in: {directory}")
-
-    # TODO: Implement consistency checking (Sprint 3)
-    click.echo("Consistency checking is not yet implemented.")
-    click.echo(f"Would check documents in: {directory}")
-
-
-@cli.command(name="fix-inconsistencies")
-@click.option(
-    "--dir",
-    "-d",
-    "directory",
-    type=click.Path(file_okay=False, dir_okay=True),
-    default="./output",
-    show_default=True,
-    help="Directory containing generated documents.",
-)
-@click.option(
-    "--dry-run",
-    is_flag=True,
-    help="Show what would be changed without making changes.",
-)
-@click.pass_context
-def fix_inconsistencies(ctx: click.Context, directory: str, dry_run: bool) -> None:
-    """
-    Automatically fix inconsistencies in generated documents.
-
-    Attempts to resolve conflicts between documents automatically.
-    Use --dry-run to preview changes without modifying files.
-
-    \b
-    Examples:
-        specify fix-inconsistencies --dir ./my-docs
-        specify fix-inconsistencies --dir ./my-docs --dry-run
-    """
-    verbose = ctx.obj.get("verbose", False)
-
-    if verbose:
-        click.echo(f"Fixing inconsistencies in: {directory}")
-        if dry_run:
-            click.echo("Dry run mode: no changes will be made.")
-
-    # TODO: Implement inconsistency fixing (Sprint 3)
-    click.echo("Inconsistency fixing is not yet implemented.")
-    click.echo(f"Would fix documents in: {directory}")
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # Entry Point
 # ─────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,41 @@
+"""
+CLI subcommands for Specify.AI.
+
+This package contains the Click subcommands registered on the top-level
+``specify`` group:
+- generate.py: Document generation command
+- config.py: API key and configuration management commands
+- consistency.py: Consistency checking and fixing commands
+
+Subcommand modules are imported lazily by ``specify.cli.LazyGroup`` the
+first time a command is resolved, so ``specify --version`` never pays for
+them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Final
+
+import click
+
+__all__ = ["PROVIDER_CHOICE", "PROVIDER_NAMES", "CliState"]
+
+# Provider names accepted by --provider options, in display order. Kept
+# here rather than imported from specify.core so that building the Click
+# commands doesn't pull in the key manager and its crypto dependencies.
+PROVIDER_NAMES: Final[tuple[str, ...]] = ("ollama", "openai", "anthropic")
+
+# Shared parameter type for every --provider option (Choice is stateless)
+PROVIDER_CHOICE: Final[click.Choice] = click.Choice(PROVIDER_NAMES, case_sensitive=False)
+
+
+@dataclass(slots=True)
+class CliState:
+    """Shared state stored on ``click.Context.obj`` by the ``specify`` group.
+
+    Attributes:
+        verbose: Whether verbose output was requested with ``--verbose``.
+    """
+
+    verbose: bool = False
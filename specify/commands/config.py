@@ -0,0 +1,148 @@
+"""
+Config command group for the Specify.AI CLI.
+
+This module provides the ``specify config`` group and its subcommands for
+storing, listing, and deleting API keys.
+
+Example usage:
+    $ specify config set-key --provider openai --key sk-xxx
+    $ specify config list-keys
+    $ specify config delete-key --provider openai
+"""
+
+from __future__ import annotations
+
+import click
+
+from specify.commands import PROVIDER_CHOICE
+
+
+@click.group()
+def config() -> None:
+    """
+    Manage configuration and API keys.
+
+    Commands for storing, listing, and deleting API keys for
+    LLM providers (Ollama, OpenAI, Anthropic).
+
+    \b
+    Examples:
+        specify config set-key --provider ollama --key "your-key"
+        specify config list-keys
+        specify config delete-key --provider ollama
+    """
+    pass
+
+
+@config.command(name="set-key")
+@click.option(
+    "--provider",
+    "-p",
+    required=True,
+    type=PROVIDER_CHOICE,
+    help="LLM provider for the API key.",
+)
+@click.option(
+    "--key",
+    "-k",
+    required=True,
+    help="API key or URL (for Ollama).",
+)
+def set_key(provider: str, key: str) -> None:
+    """
+    Store an API key for a provider.
+
+    API keys are stored locally in the user's home directory.
+    For Ollama, the key can be the base URL of your Ollama instance.
+
+    \b
+    Examples:
+        specify config set-key --provider openai --key sk-xxx
+        specify config set-key --provider anthropic --key sk-ant-xxx
+        specify config set-key --provider ollama --key http://localhost:11434
+    """
+    from specify.core import KeyManager, KeyValidationError
+
+    try:
+        key_manager = KeyManager()
+        key_manager.store_key(provider, key)
+        click.echo(f"[OK] API key stored for {provider}")
+    except KeyValidationError as e:
+        raise click.ClickException(str(e)) from e
+
+
+@config.command(name="list-keys")
+def list_keys() -> None:
+    """
+    List all configured providers.
+
+    Shows which LLM providers have API keys configured.
+    Keys are displayed in masked format (e.g., sk-...abc).
+    Keys are sourced from both the local store and environment variables.
+
+    \b
+    Example:
+        specify config list-keys
+    """
+    from specify.core import KeyManager
+
+    key_manager = KeyManager()
+    keys = key_manager.list_keys()
+
+    if not keys:
+        click.echo("No API keys configured.")
+        return
+
+    # Print formatted output
+    click.echo("Configured API Keys:")
+    click.echo("-" * 40)
+    for provider, masked_key in keys.items():
+        click.echo(f"  {provider}: {masked_key}")
+
+
+@config.command(name="delete-key")
+@click.option(
+    "--provider",
+    "-p",
+    required=False,
+    type=PROVIDER_CHOICE,
+    help="Provider to delete the key for. If not specified, shows interactive selection.",
+)
+def delete_key(provider: str | None) -> None:
+    """
+    Delete a stored API key.
+
+    Removes the API key for the specified provider from local storage.
+    If --provider is not specified, shows an interactive list of
+    configured providers to select from.
+
+    Note: This does not affect environment variables.
+
+    \b
+    Examples:
+        specify config delete-key --provider openai
+        specify config delete-key
+    """
+    from specify.cli import run_interactive_delete
+    from specify.core import KeyManager, KeyNotFoundError
+
+    key_manager = KeyManager()
+    keys = key_manager.list_keys()
+
+    # If provider is specified, use non-interactive mode (backward compatibility)
+    if provider:
+        try:
+            key_manager.delete_key(provider)
+            click.echo(f"[OK] API key deleted for {provider}")
+        except KeyNotFoundError as e:
+            raise click.ClickException(str(e)) from e
+        return
+
+    # No provider specified - show interactive selection
+    # Check if any keys are configured
+    if not keys:
+        click.echo("No API keys configured.")
+        return
+
+    # Run interactive deletion
+    run_interactive_delete(key_manager, keys)
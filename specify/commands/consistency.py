@@ -0,0 +1,88 @@
+"""
+Consistency commands for the Specify.AI CLI.
+
+This module provides the ``specify check-consistency`` and
+``specify fix-inconsistencies`` subcommands.
+
+Example usage:
+    $ specify check-consistency --dir ./my-docs
+    $ specify fix-inconsistencies --dir ./my-docs --dry-run
+"""
+
+from __future__ import annotations
+
+import click
+
+from specify.commands import CliState
+
+
+@click.command(name="check-consistency")
+@click.option(
+    "--dir",
+    "-d",
+    "directory",
+    type=click.Path(file_okay=False, dir_okay=True),
+    default="./output",
+    show_default=True,
+    help="Directory containing generated documents.",
+)
+@click.pass_context
+def check_consistency(ctx: click.Context, directory: str) -> None:
+    """
+    Check consistency between generated documents.
+
+    Analyzes all generated documents in the specified directory
+    and reports any inconsistencies or conflicts.
+
+    \b
+    Example:
+        specify check-consistency --dir ./my-docs
+    """
+    verbose = ctx.ensure_object(CliState).verbose
+
+    if verbose:
+        click.echo(f"Checking consistency in: {directory}")
+
+    # TODO: Implement consistency checking (Sprint 3)
+    click.echo("Consistency checking is not yet implemented.")
+    click.echo(f"Would check documents in: {directory}")
+
+
+@click.command(name="fix-inconsistencies")
+@click.option(
+    "--dir",
+    "-d",
+    "directory",
+    type=click.Path(file_okay=False, dir_okay=True),
+    default="./output",
+    show_default=True,
+    help="Directory containing generated documents.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show what would be changed without making changes.",
+)
+@click.pass_context
+def fix_inconsistencies(ctx: click.Context, directory: str, dry_run: bool) -> None:
+    """
+    Automatically fix inconsistencies in generated documents.
+
+    Attempts to resolve conflicts between documents automatically.
+    Use --dry-run to preview changes without modifying files.
+
+    \b
+    Examples:
+        specify fix-inconsistencies --dir ./my-docs
+        specify fix-inconsistencies --dir ./my-docs --dry-run
+    """
+    verbose = ctx.ensure_object(CliState).verbose
+
+    if verbose:
+        click.echo(f"Fixing inconsistencies in: {directory}")
+        if dry_run:
+            click.echo("Dry run mode: no changes will be made.")
+
+    # TODO: Implement inconsistency fixing (Sprint 3)
+    click.echo("Inconsistency fixing is not yet implemented.")
+    click.echo(f"Would fix documents in: {directory}")
@@ -0,0 +1,137 @@
+"""
+Generate command for the Specify.AI CLI.
+
+This module provides the ``specify generate`` subcommand, which turns a
+product description prompt into one or more documents.
+
+Example usage:
+    $ specify generate --prompt "Build a task app" --type all
+"""
+
+from __future__ import annotations
+
+from typing import Final
+
+import click
+
+from specify.commands import PROVIDER_CHOICE, CliState
+
+# Document types accepted by --type ("all" generates every document)
+DOC_TYPE_CHOICE: Final[click.Choice] = click.Choice(
+    ("app-flow", "bdd", "design-doc", "prd", "tech-arch", "all"),
+    case_sensitive=False,
+)
+
+
+@click.command()
+@click.option(
+    "--prompt",
+    "-p",
+    required=True,
+    help="Product description prompt for document generation.",
+)
+@click.option(
+    "--type",
+    "-t",
+    "doc_type",
+    type=DOC_TYPE_CHOICE,
+    default="all",
+    show_default=True,
+    help="Type of document to generate.",
+)
+@click.option(
+    "--provider",
+    type=PROVIDER_CHOICE,
+    default="ollama",
+    show_default=True,
+    help="LLM provider to use for generation.",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(file_okay=False, dir_okay=True, writable=True),
+    default="./output",
+    show_default=True,
+    help="Output directory for generated documents.",
+)
+@click.option(
+    "--model",
+    "-m",
+    default=None,
+    help="Specific model to use (provider-specific).",
+)
+@click.option(
+    "--no-recommendations",
+    is_flag=True,
+    help="Skip clarification questions for missing information.",
+)
+@click.option(
+    "--no-consistency-check",
+    is_flag=True,
+    help="Skip post-generation consistency check prompt.",
+)
+@click.option(
+    "--auto-fix",
+    is_flag=True,
+    help="Automatically fix inconsistencies without prompting.",
+)
+@click.pass_context
+def generate(
+    ctx: click.Context,
+    prompt: str,
+    doc_type: str,
+    provider: str,
+    output: str,
+    model: str | None,
+    no_recommendations: bool,
+    no_consistency_check: bool,
+    auto_fix: bool,
+) -> None:
+    """
+    Generate documentation from a product description prompt.
+
+    This command generates one or more documents based on the provided
+    prompt. Documents follow the rules defined in the plan/rules/ directory.
+
+    \b
+    Document Types:
+        - app-flow: App Flow Document (user flow specification)
+        - bdd: Backend Design Document
+        - design-doc: Design Document (design system specification)
+        - prd: Product Requirements Document
+        - tech-arch: Technical Architecture Document
+        - all: Generate all 5 documents
+
+    \b
+    Examples:
+        specify generate -p "Build a task app" -t all
+        specify generate -p "Build a task app" -t prd --provider openai
+        specify generate -p "Build a task app" -t all -o ./my-docs
+        specify generate -p "Build a task app" -t all --no-consistency-check
+        specify generate -p "Build a task app" -t all --auto-fix
+    """
+    # Resolved at call time so the consistency loop stays patchable on specify.cli
+    from specify.cli import consistency_check_loop
+
+    verbose = ctx.ensure_object(CliState).verbose
+
+    if verbose:
+        click.echo(f"Generating {doc_type} document(s)...")
+        click.echo(f"Provider: {provider}")
+        click.echo(f"Output directory: {output}")
+
+    # TODO: Implement document generation (Sprint 2-3)
+    click.echo(
+        "[PLACEHOLDER] Document generation is not yet implemented. "
+        "This is a stub that will be fully implemented in Sprint 2-3."
+    )
+    click.echo(f"Would generate {doc_type} document(s) using {provider}.")
+    click.echo(
+        f"Prompt: {prompt[:100]}..." if len(prompt) > 100 else f"Prompt: {prompt}"
+    )
+
+    # Run consistency check loop after generation by default
+    # Skip if --no-consistency-check is provided
+    # If --auto-fix is provided, run consistency check with auto-fix enabled
+    if not no_consistency_check:
+        consistency_check_loop(output, auto_fix=auto_fix)
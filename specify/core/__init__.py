@@ -7,19 +7,39 @@ This module contains core functionality including:
 - File output handling (output.py)
 
 These components implement the core infrastructure for Sprint 2.
+
+Public names are resolved lazily (PEP 562), so importing ``specify.core``
+does not load ``key_manager`` and its cryptography dependencies until one
+of its names is first accessed.
 """
 
 from __future__ import annotations
 
-from specify.core.key_manager import (
-    CryptoManager,
-    DecryptionError,
-    EncryptionError,
-    KeyManager,
-    KeyNotFoundError,
-    KeyValidationError,
-    MachineIdError,
-)
+from typing import TYPE_CHECKING, Final
+
+from specify.utils.lazy import lazy_attrs
+
+if TYPE_CHECKING:
+    from specify.core.key_manager import (
+        CryptoManager,
+        DecryptionError,
+        EncryptionError,
+        KeyManager,
+        KeyNotFoundError,
+        KeyValidationError,
+        MachineIdError,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS: Final[dict[str, str]] = {
+    "CryptoManager": "key_manager",
+    "DecryptionError": "key_manager",
+    "EncryptionError": "key_manager",
+    "KeyManager": "key_manager",
+    "KeyNotFoundError": "key_manager",
+    "KeyValidationError": "key_manager",
+    "MachineIdError": "key_manager",
+}
 
 __all__ = [
     "CryptoManager",
@@ -30,3 +50,6 @@ __all__ = [
     "KeyValidationError",
     "MachineIdError",
 ]
+
+# Module-level __getattr__/__dir__ hooks (PEP 562)
+__getattr__, __dir__ = lazy_attrs(__name__, _LAZY_ATTRS, globals())
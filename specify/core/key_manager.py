@@ -26,23 +26,67 @@ Example usage:
 from __future__ import annotations
 
 import base64
+import functools
 import json
+import logging
 import os
 import platform
+import re
 import socket
 import stat
 import subprocess
+import tempfile
 import warnings
 from pathlib import Path
-from typing import Any, Final, TypedDict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Final, TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    # cryptography is imported where keys are derived, so that commands
+    # which never decrypt (presence checks, env-only lookups) skip loading it
+    from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+logger = logging.getLogger(__name__)
+
+# Use orjson for keys.json I/O when it is installed, else the stdlib json.
+# Both backends emit compact UTF-8 bytes in dict insertion order (callers
+# build sorted dicts), and orjson's JSONDecodeError subclasses
+# json.JSONDecodeError.
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
-from cryptography.fernet import Fernet
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 # Allowed LLM providers
-VALID_PROVIDERS: Final[set[str]] = {"ollama", "openai", "anthropic"}
+VALID_PROVIDERS: Final[frozenset[str]] = frozenset({"ollama", "openai", "anthropic"})
+
+# Pre-rendered provider list for validation error messages
+_VALID_PROVIDERS_MSG: Final[str] = ", ".join(sorted(VALID_PROVIDERS))
+
+# Common spellings of each provider mapped to its canonical (lowercase) name,
+# so the usual inputs skip the case-folding allocation
+_CANONICAL_PROVIDERS: Final[dict[str, str]] = {
+    alias: provider
+    for provider in VALID_PROVIDERS
+    for alias in (provider, provider.upper(), provider.capitalize())
+}
 
 # Mapping of providers to their environment variable names
 ENV_VAR_MAPPING: Final[dict[str, str]] = {
@@ -55,6 +99,76 @@ ENV_VAR_MAPPING: Final[dict[str, str]] = {
 CONFIG_DIR_NAME: Final[str] = ".specify"
 KEYS_FILE_NAME: Final[str] = "keys.json"
 
+# keys.json format written by KeyManager (4: nested configs, raw Fernet tokens)
+KEYS_FILE_VERSION: Final[int] = 4
+
+# Matches the UUID in `ioreg -rd1 -c IOPlatformExpertDevice` output
+_IOREG_UUID_RE: Final[re.Pattern[str]] = re.compile(r'"IOPlatformUUID"\s*=\s*"([^"]+)"')
+
+
+@functools.cache
+def _default_config_dir() -> Path:
+    """Return the default config directory, resolving the home dir once.
+
+    Returns:
+        Path to ``~/.specify``.
+    """
+    return Path.home() / CONFIG_DIR_NAME
+
+
+def _canonical_provider(provider: str) -> str:
+    """Return the canonical lowercase form of a provider name.
+
+    Known providers in lowercase, uppercase, or capitalized form are
+    resolved with a single dict lookup; anything else falls back to
+    ``str.casefold()``. No validation is performed.
+
+    Args:
+        provider: The provider name as given by the caller.
+
+    Returns:
+        The lowercase provider name.
+    """
+    canonical = _CANONICAL_PROVIDERS.get(provider)
+    return canonical if canonical is not None else provider.casefold()
+
+
+def _looks_like_token(value: Any) -> bool:
+    """Return whether a stored entry holds a Fernet token rather than a key.
+
+    Matches raw tokens and the base64-wrapped form written before
+    ``KEYS_FILE_VERSION`` 4, in both the string and nested entry formats.
+
+    Args:
+        value: A provider entry from keys.json.
+
+    Returns:
+        True if the entry's API key looks encrypted.
+    """
+    api_key = value.get("api_key") if isinstance(value, dict) else value
+    return isinstance(api_key, str) and api_key.startswith(("gAAAAA", "Z0FBQUFB"))
+
+
+def _mask_key(key: str) -> str:
+    """Mask a key for secure display.
+
+    Keys with length >= 6 show first 3 chars + "..." + last 3 chars.
+    Keys with length < 6 are shown as "***".
+
+    Args:
+        key: The API key to mask.
+
+    Returns:
+        The masked key string.
+
+    Example:
+        >>> _mask_key("sk-proj-abc123")
+        'sk-...123'
+        >>> _mask_key("abc")
+        '***'
+    """
+    return "***" if len(key) < 6 else f"{key[:3]}...{key[-3:]}"
+
 
 class ProviderConfig(TypedDict, total=False):
     """Type definition for provider configuration.
@@ -118,8 +232,11 @@ class CryptoManager:
     1. A machine-specific identifier (machine-id, IOPlatformUUID, or MachineGuid)
     2. A randomly generated salt stored in ~/.specify/.salt
 
-    Key derivation uses PBKDF2HMAC with SHA-256 and 1,200,000 iterations
-    (OWASP recommended minimum).
+    Platform machine IDs are high-entropy values, so the key is derived
+    with a single HKDF-SHA256 extract+expand. The guessable hostname +
+    username fallback ID keeps PBKDF2HMAC with SHA-256 and 1,200,000
+    iterations (OWASP recommended minimum), which is also used to read
+    data written before the HKDF switch.
 
     Attributes:
         config_dir: Path to the configuration directory.
@@ -128,6 +245,19 @@ class CryptoManager:
     SALT_FILE_NAME: str = ".salt"
     PBKDF2_ITERATIONS: int = 1_200_000  # OWASP recommended minimum
 
+    # Key derivation function identifiers, as recorded in keys.json
+    KDF_PBKDF2: Final[str] = "pbkdf2"
+    KDF_HKDF: Final[str] = "hkdf"
+    HKDF_INFO: Final[bytes] = b"specify-fernet-v1"
+
+    # Derived Fernet keys shared by all instances in this process, keyed by
+    # (kdf, salt, machine ID); a new salt or machine ID naturally misses
+    _derived_keys: ClassVar[dict[tuple[str, bytes, bytes], bytes]] = {}
+
+    # Machine ID and whether it is the weak fallback, per platform.system();
+    # probing can spawn ioreg or open the registry, and the ID is stable
+    _machine_ids: ClassVar[dict[str, tuple[bytes, bool]]] = {}
+
     def __init__(self, config_dir: Path) -> None:
         """Initialize CryptoManager with the config directory.
 
@@ -135,34 +265,57 @@ class CryptoManager:
             config_dir: Path to the configuration directory (e.g., ~/.specify).
         """
         self.config_dir = config_dir
-        self._fernet: Fernet | None = None
+        self._fernets: dict[str, Fernet] = {}
+        self._weak_machine_id = False
 
-    def encrypt(self, plaintext: str) -> str:
-        """Encrypt a plaintext string and return base64-encoded ciphertext.
+    @property
+    def preferred_kdf(self) -> str:
+        """The KDF new ciphertexts are written with.
+
+        HKDF for platform machine IDs; PBKDF2 when only the fallback
+        (hostname + username) ID is available. If no machine ID can be
+        determined at all, key derivation itself reports the error.
+        """
+        try:
+            self._get_machine_id()
+        except MachineIdError:
+            return self.KDF_HKDF
+        return self.KDF_PBKDF2 if self._weak_machine_id else self.KDF_HKDF
+
+    def encrypt(self, plaintext: str, kdf: str | None = None) -> str:
+        """Encrypt a plaintext string and return a Fernet token.
+
+        Fernet tokens are already URL-safe base64, so they are stored as-is.
 
         Args:
             plaintext: The string to encrypt.
+            kdf: Key derivation function to use; defaults to ``preferred_kdf``.
 
         Returns:
-            Base64-encoded ciphertext string.
+            Fernet token string.
 
         Raises:
             EncryptionError: If encryption fails.
         """
         try:
-            fernet = self._get_fernet()
-            ciphertext = fernet.encrypt(plaintext.encode("utf-8"))
-            return base64.urlsafe_b64encode(ciphertext).decode("utf-8")
+            fernet = self._get_fernet(kdf)
+            return fernet.encrypt(plaintext.encode("utf-8")).decode("ascii")
         except Exception as e:
             raise EncryptionError(
                 f"Failed to encrypt data: {e}"
             ) from e
 
-    def decrypt(self, ciphertext: str) -> str:
+    def decrypt(
+        self, ciphertext: str, kdf: str | None = None, wrapped: bool = False
+    ) -> str:
         """Decrypt a ciphertext string and return plaintext.
 
         Args:
-            ciphertext: Base64-encoded ciphertext string.
+            ciphertext: Fernet token string.
+            kdf: Key derivation function the ciphertext was written with;
+                 defaults to ``preferred_kdf``.
+            wrapped: Whether the token carries the extra base64 layer that
+                     keys files before version 4 added around it.
 
         Returns:
             Decrypted plaintext string.
@@ -171,11 +324,11 @@ class CryptoManager:
             DecryptionError: If decryption fails (corrupted data, wrong key, etc.).
         """
         try:
-            fernet = self._get_fernet()
-            # Decode from base64
-            decoded = base64.urlsafe_b64decode(ciphertext.encode("utf-8"))
-            plaintext = fernet.decrypt(decoded)
-            return plaintext.decode("utf-8")
+            fernet = self._get_fernet(kdf)
+            token = ciphertext.encode("ascii")
+            if wrapped:
+                token = base64.urlsafe_b64decode(token)
+            return fernet.decrypt(token).decode("utf-8")
         except DecryptionError:
             raise
         except Exception as e:
@@ -188,8 +341,11 @@ class CryptoManager:
                 "You may need to re-store your API keys."
             ) from e
 
-    def _get_fernet(self) -> Fernet:
-        """Get or create the Fernet instance with derived key.
+    def _get_fernet(self, kdf: str | None = None) -> Fernet:
+        """Get or create the Fernet instance for a key derivation function.
+
+        Args:
+            kdf: Key derivation function; defaults to ``preferred_kdf``.
 
         Returns:
             Fernet instance for encryption/decryption.
@@ -197,10 +353,14 @@ class CryptoManager:
         Raises:
             EncryptionError: If key derivation fails.
         """
-        if self._fernet is None:
-            key = self._derive_key()
-            self._fernet = Fernet(key)
-        return self._fernet
+        if kdf is None:
+            kdf = self.preferred_kdf
+        fernet = self._fernets.get(kdf)
+        if fernet is None:
+            from cryptography.fernet import Fernet
+
+            fernet = self._fernets[kdf] = Fernet(self._derive_key(kdf))
+        return fernet
 
     def _get_machine_id(self) -> bytes:
         """Get a machine-specific identifier for key derivation.
@@ -211,6 +371,9 @@ class CryptoManager:
         - Windows: MachineGuid from registry
         - Fallback: hostname + username
 
+        The identifier is probed once per process and shared by all
+        instances. Failures are not cached, so a later call retries.
+
         Returns:
             Machine-specific identifier as bytes.
 
@@ -219,14 +382,23 @@ class CryptoManager:
         """
         system = platform.system()
 
+        cached = CryptoManager._machine_ids.get(system)
+        if cached is not None:
+            machine_id, weak = cached
+            self._weak_machine_id = weak
+            return machine_id
+
         if system == "Linux":
-            return self._get_linux_machine_id()
+            machine_id = self._get_linux_machine_id()
         elif system == "Darwin":
-            return self._get_macos_machine_id()
+            machine_id = self._get_macos_machine_id()
         elif system == "Windows":
-            return self._get_windows_machine_id()
+            machine_id = self._get_windows_machine_id()
         else:
-            return self._get_fallback_machine_id()
+            machine_id = self._get_fallback_machine_id()
+
+        CryptoManager._machine_ids[system] = (machine_id, self._weak_machine_id)
+        return machine_id
 
     def _get_linux_machine_id(self) -> bytes:
         """Get machine-id from Linux systems.
@@ -274,12 +446,9 @@ class CryptoManager:
                 timeout=10,
             )
 
-            for line in result.stdout.split("\n"):
-                if "IOPlatformUUID" in line:
-                    # Extract UUID from the line
-                    uuid = line.split("=")[-1].strip('" \n')
-                    if uuid:
-                        return uuid.encode("utf-8")
+            match = _IOREG_UUID_RE.search(result.stdout)
+            if match:
+                return match.group(1).encode("utf-8")
 
             raise MachineIdError("Could not find IOPlatformUUID in ioreg output")
         except subprocess.TimeoutExpired as e:
@@ -338,6 +507,7 @@ class CryptoManager:
         Raises:
             MachineIdError: If even fallback fails.
         """
+        self._weak_machine_id = True
         warnings.warn(
             "Using insecure fallback machine ID (hostname + username). "
             "Platform-specific machine ID could not be determined. "
@@ -356,34 +526,68 @@ class CryptoManager:
                 f"Could not determine fallback machine ID: {e}"
             ) from e
 
-    def _derive_key(self) -> bytes:
-        """Derive a Fernet key from machine ID and salt using PBKDF2HMAC.
+    def _derive_key(self, kdf: str) -> bytes:
+        """Derive a Fernet key from machine ID and salt.
 
-        Uses PBKDF2HMAC with SHA-256 and 1,200,000 iterations
-        to derive a 32-byte key, then encodes it for Fernet usage.
+        With ``KDF_HKDF``, uses a single HKDF-SHA256 extract+expand, which
+        is sufficient for a high-entropy machine ID. With ``KDF_PBKDF2``,
+        uses PBKDF2HMAC with SHA-256 and 1,200,000 iterations. Either way
+        a 32-byte key is derived and encoded for Fernet usage.
+
+        The result is memoized per process for each (kdf, salt, machine ID)
+        triple, so further CryptoManager instances for the same config
+        directory skip the derivation. It is deliberately never written
+        to disk: a stored key would decrypt keys.json without the machine
+        ID, defeating the binding the KDF provides.
+
+        Args:
+            kdf: ``KDF_HKDF`` or ``KDF_PBKDF2``.
 
         Returns:
             32-byte key suitable for Fernet encryption.
 
         Raises:
-            EncryptionError: If key derivation fails.
+            EncryptionError: If key derivation fails or ``kdf`` is unknown.
         """
         try:
             salt = self._load_or_create_salt()
             machine_id = self._get_machine_id()
 
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=self.PBKDF2_ITERATIONS,
-                backend=default_backend(),
-            )
+            cache_key = (kdf, salt, machine_id)
+            cached = CryptoManager._derived_keys.get(cache_key)
+            if cached is not None:
+                return cached
+
+            from cryptography.hazmat.backends import default_backend
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+            from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+            deriver: HKDF | PBKDF2HMAC
+            if kdf == self.KDF_HKDF:
+                deriver = HKDF(
+                    algorithm=hashes.SHA256(),
+                    length=32,
+                    salt=salt,
+                    info=self.HKDF_INFO,
+                    backend=default_backend(),
+                )
+            elif kdf == self.KDF_PBKDF2:
+                deriver = PBKDF2HMAC(
+                    algorithm=hashes.SHA256(),
+                    length=32,
+                    salt=salt,
+                    iterations=self.PBKDF2_ITERATIONS,
+                    backend=default_backend(),
+                )
+            else:
+                raise EncryptionError(f"Unknown key derivation function: {kdf}")
 
-            key = kdf.derive(machine_id)
             # Encode to URL-safe base64 for Fernet
-            return base64.urlsafe_b64encode(key)
-        except MachineIdError:
+            key = base64.urlsafe_b64encode(deriver.derive(machine_id))
+            CryptoManager._derived_keys[cache_key] = key
+            return key
+        except (EncryptionError, MachineIdError):
             raise
         except Exception as e:
             raise EncryptionError(f"Failed to derive encryption key: {e}") from e
@@ -487,6 +691,18 @@ class KeyManager:
         {'openai': 'sk-...123'}
     """
 
+    __slots__ = (
+        "_cache",
+        "_config_dir_ready",
+        "_crypto_manager",
+        "_entries",
+        "_entries_stamp",
+        "_negative",
+        "_stored_data",
+        "config_dir",
+        "keys_file",
+    )
+
     def __init__(self, config_dir: Path | None = None) -> None:
         """Initialize the KeyManager.
 
@@ -508,7 +724,7 @@ class KeyManager:
                     )
                 self.config_dir: Path = config_path
             else:
-                self.config_dir = Path.home() / CONFIG_DIR_NAME
+                self.config_dir = _default_config_dir()
         else:
             self.config_dir = config_dir
 
@@ -517,6 +733,24 @@ class KeyManager:
         # Initialize CryptoManager for encryption/decryption
         self._crypto_manager = CryptoManager(self.config_dir)
 
+        # Parsed (still encrypted) keys file from the last load/save, valid
+        # while the file's (inode, mtime, size) stamp is unchanged
+        self._stored_data: dict[str, Any] = {}
+        self._entries: Mapping[str, ProviderConfig] | None = None
+        self._entries_stamp: tuple[int, int, int] | None = None
+
+        # Decrypted keys, derived lazily from the stored entries and dropped
+        # whenever they are replaced
+        self._cache: Mapping[str, ProviderConfig] | None = None
+
+        # Valid providers with no entry in the local store (negative cache),
+        # rebuilt whenever the stored entries are replaced
+        self._negative: frozenset[str] = frozenset(VALID_PROVIDERS)
+
+        # Set once the config directory has been created/secured, so later
+        # saves skip the mkdir and chmod syscalls
+        self._config_dir_ready = False
+
     def store_key(
         self,
         provider: str,
@@ -547,12 +781,58 @@ class KeyManager:
             >>> km.store_key("openai", "sk-proj-abc123", model="gpt-4")
             >>> km.store_key("ollama", None, model="llama3", base_url="http://localhost:11434")
         """
+        provider_lower, key = self._validate_store_args(provider, key)
+        self._store_configs({provider_lower: (key, model, base_url)})
+
+    def store_keys(self, mapping: Mapping[str, str | None]) -> None:
+        """Store API keys for several providers in a single write.
+
+        Every entry is validated before anything is written, so an invalid
+        provider or empty key leaves the store untouched. Existing model and
+        base_url settings for each provider are preserved.
+
+        Args:
+            mapping: Provider name -> API key. The key may be None for
+                     providers like ollama that don't require one.
+
+        Raises:
+            KeyValidationError: If any provider is invalid or any key is
+                              empty (for providers other than ollama).
+
+        Example:
+            >>> km = KeyManager()
+            >>> km.store_keys({"openai": "sk-proj-abc123", "anthropic": "sk-ant-xyz"})
+        """
+        updates: dict[str, tuple[str | None, str | None, str | None]] = {}
+        for provider, key in mapping.items():
+            provider_lower, key = self._validate_store_args(provider, key)
+            updates[provider_lower] = (key, None, None)
+
+        if updates:
+            self._store_configs(updates)
+
+    def _validate_store_args(
+        self, provider: str, key: str | None
+    ) -> tuple[str, str | None]:
+        """Validate and normalize a provider/key pair for storing.
+
+        Args:
+            provider: The provider name as given by the caller.
+            key: The API key, or None for providers that don't require one.
+
+        Returns:
+            Tuple of (canonical provider name, stripped key).
+
+        Raises:
+            KeyValidationError: If the provider is invalid or key is empty
+                              (for providers other than ollama).
+        """
         # Validate provider
-        provider_lower = provider.lower()
+        provider_lower = _canonical_provider(provider)
         if provider_lower not in VALID_PROVIDERS:
             raise KeyValidationError(
                 f"Invalid provider: {provider}. "
-                f"Must be one of: {', '.join(sorted(VALID_PROVIDERS))}"
+                f"Must be one of: {_VALID_PROVIDERS_MSG}"
             )
 
         # Validate key is not empty (except for ollama which doesn't need a key)
@@ -564,30 +844,45 @@ class KeyManager:
                 )
             key = key.strip()
 
+        return provider_lower, key
+
+    def _store_configs(
+        self, updates: dict[str, tuple[str | None, str | None, str | None]]
+    ) -> None:
+        """Merge validated provider updates into the store and save once.
+
+        Args:
+            updates: Canonical provider name -> (api_key, model, base_url).
+                     None values keep the provider's existing setting.
+        """
         # Ensure config directory exists
         self._ensure_config_dir()
 
-        # Load existing keys
-        keys = self._load_keys()
+        # Read-modify-write against the cached mapping; only _save_keys
+        # touches disk
+        keys = self._cached_keys()
+        new_keys = dict(keys)
 
-        # Store/update the key with configuration
-        if provider_lower not in keys:
-            keys[provider_lower] = {
-                "api_key": key,
-                "model": model,
-                "base_url": base_url,
-            }
-        else:
-            # Update existing config, preserving api_key if not provided
-            existing = keys[provider_lower]
-            keys[provider_lower] = {
-                "api_key": key if key is not None else existing.get("api_key"),
-                "model": model if model is not None else existing.get("model"),
-                "base_url": base_url if base_url is not None else existing.get("base_url"),
-            }
+        for provider_lower, (key, model, base_url) in updates.items():
+            existing = keys.get(provider_lower)
+
+            # Store/update the key with configuration
+            if existing is None:
+                new_keys[provider_lower] = {
+                    "api_key": key,
+                    "model": model,
+                    "base_url": base_url,
+                }
+            else:
+                # Update existing config, preserving api_key if not provided
+                new_keys[provider_lower] = {
+                    "api_key": key if key is not None else existing.get("api_key"),
+                    "model": model if model is not None else existing.get("model"),
+                    "base_url": base_url if base_url is not None else existing.get("base_url"),
+                }
 
         # Save keys to file
-        self._save_keys(keys)
+        self._save_keys(new_keys)
 
     def get_key(self, provider: str) -> str:
         """Retrieve an API key for a provider.
@@ -612,12 +907,14 @@ class KeyManager:
             >>> print(key)
             sk-test123
         """
-        provider_lower = provider.lower()
-
-        # 1. Check local store (JSON file)
-        keys = self._load_keys()
-        if provider_lower in keys:
-            api_key = keys[provider_lower].get("api_key")
+        provider_lower = _canonical_provider(provider)
+
+        # 1. Check local store (JSON file), skipping known-missing providers
+        # before anything is decrypted
+        self._stored_entries()
+        if provider_lower not in self._negative:
+            config = self._cached_keys().get(provider_lower)
+            api_key = config.get("api_key") if config else None
             if api_key:
                 return api_key
 
@@ -650,25 +947,26 @@ class KeyManager:
             >>> km.list_keys()
             {'openai': 'sk-...123'}
         """
-        keys = self._load_keys()
-
-        # Add keys from environment variables if not already in file
+        keys = self._cached_keys()
+        mask = _mask_key
+        env_get = os.environ.get
+
+        # Mask local keys directly from the cache, without copying it
+        masked_keys = {
+            provider: mask(api_key)
+            for provider, config in keys.items()
+            if (api_key := config.get("api_key"))
+        }
+
+        # Add keys from environment variables if not already in file.
+        # Providers present in the file (even without an api_key, e.g. an
+        # Ollama model/base_url entry) are not overridden from the env.
         for provider, env_var in ENV_VAR_MAPPING.items():
-            if provider not in keys:
-                env_value = os.environ.get(env_var)
-                if env_value:
-                    keys[provider] = {
-                        "api_key": env_value,
-                        "model": None,
-                        "base_url": None,
-                    }
-
-        # Mask all keys for display
-        masked_keys = {}
-        for provider, config in keys.items():
-            api_key = config.get("api_key")
-            if api_key:
-                masked_keys[provider] = self._mask_key(api_key)
+            if provider in keys:
+                continue
+            env_value = env_get(env_var)
+            if env_value:
+                masked_keys[provider] = mask(env_value)
 
         return masked_keys
 
@@ -690,17 +988,14 @@ class KeyManager:
             >>> km.store_key("openai", "sk-test")
             >>> km.delete_key("openai")
         """
-        keys = self._load_keys()
-        provider_lower = provider.lower()
+        keys = self._cached_keys()
+        provider_lower = _canonical_provider(provider)
 
         if provider_lower not in keys:
             raise KeyNotFoundError(provider_lower)
 
-        # Remove the key
-        del keys[provider_lower]
-
-        # Save keys to file
-        self._save_keys(keys)
+        # Save the remaining keys to file
+        self._save_keys({p: c for p, c in keys.items() if p != provider_lower})
 
     def key_exists(self, provider: str) -> bool:
         """Check if a provider is configured.
@@ -726,11 +1021,14 @@ class KeyManager:
             >>> km.key_exists("ollama")
             True
         """
-        provider_lower = provider.lower()
-
-        # Check local store
-        keys = self._load_keys()
-        if provider_lower in keys:
+        provider_lower = _canonical_provider(provider)
+
+        # Check local store, skipping known-missing providers. Only presence
+        # matters here, so the stored entries are used without decrypting.
+        # Environment variables are always re-read since they can change at
+        # runtime.
+        keys = self._stored_entries()
+        if provider_lower not in self._negative and provider_lower in keys:
             config = keys[provider_lower]
             # For Ollama, check if any configuration exists
             if provider_lower == "ollama":
@@ -767,7 +1065,7 @@ class KeyManager:
             True
         """
         # Check local store
-        keys = self._load_keys()
+        keys = self._stored_entries()
         for provider, config in keys.items():
             if config.get("api_key"):
                 return True
@@ -794,7 +1092,7 @@ class KeyManager:
             >>> km.list_providers()
             ['openai']
         """
-        keys = self._load_keys()
+        keys = self._stored_entries()
         return sorted(keys.keys())
 
     def get_model(self, provider: str) -> str | None:
@@ -812,8 +1110,8 @@ class KeyManager:
             >>> km.get_model("openai")
             'gpt-4'
         """
-        provider_lower = provider.lower()
-        keys = self._load_keys()
+        provider_lower = _canonical_provider(provider)
+        keys = self._stored_entries()
 
         if provider_lower in keys:
             return keys[provider_lower].get("model")
@@ -835,8 +1133,8 @@ class KeyManager:
             >>> km.get_base_url("ollama")
             'http://localhost:11434'
         """
-        provider_lower = provider.lower()
-        keys = self._load_keys()
+        provider_lower = _canonical_provider(provider)
+        keys = self._stored_entries()
 
         if provider_lower in keys:
             return keys[provider_lower].get("base_url")
@@ -859,37 +1157,16 @@ class KeyManager:
             >>> km.get_provider_config("openai")
             {'api_key': 'sk-test', 'model': 'gpt-4', 'base_url': None}
         """
-        provider_lower = provider.lower()
-        keys = self._load_keys()
+        provider_lower = _canonical_provider(provider)
+        keys = self._cached_keys()
 
         if provider_lower in keys:
             return dict(keys[provider_lower])
 
         return None
 
-    def _mask_key(self, key: str) -> str:
-        """Mask a key for secure display.
-
-        Keys with length >= 6 show first 3 chars + "..." + last 3 chars.
-        Keys with length < 6 are shown as "***".
-
-        Args:
-            key: The API key to mask.
-
-        Returns:
-            The masked key string.
-
-        Example:
-            >>> km = KeyManager()
-            >>> km._mask_key("sk-proj-abc123")
-            'sk-...123'
-            >>> km._mask_key("abc")
-            '***'
-        """
-        if len(key) < 6:
-            return "***"
-
-        return f"{key[:3]}...{key[-3:]}"
+    # Kept as a method for callers (and tests) that mask via the instance
+    _mask_key = staticmethod(_mask_key)
 
     def _migrate_old_format(self, keys: dict[str, Any]) -> dict[str, ProviderConfig]:
         """Migrate old format keys to new nested format.
@@ -941,9 +1218,9 @@ class KeyManager:
     def _load_keys(self) -> dict[str, ProviderConfig]:
         """Load keys from the JSON file.
 
-        Handles both encrypted and plain-text formats for backward compatibility.
-        Also handles old simple-string format and new nested-object format.
-        Migration from old format to new happens automatically on load.
+        Returns a copy of the cached mapping and of each provider's config,
+        so callers may mutate either level before passing it to
+        ``_save_keys`` without touching the cache.
 
         Returns:
             Dictionary of provider -> ProviderConfig mappings (always decrypted).
@@ -953,23 +1230,135 @@ class KeyManager:
             KeyValidationError: If the keys file contains invalid JSON.
             DecryptionError: If decryption fails (corrupted data, wrong key, etc.).
         """
-        if not self.keys_file.exists():
-            return {}
+        return {
+            provider: config.copy() for provider, config in self._cached_keys().items()
+        }
+
+    def _set_entries(
+        self,
+        data: dict[str, Any] | None,
+        stamp: tuple[int, int, int] | None,
+    ) -> Mapping[str, ProviderConfig]:
+        """Replace the stored-entries cache and drop the decrypted cache.
+
+        Args:
+            data: Parsed keys file contents, or None to drop the cache.
+            stamp: The (inode, mtime_ns, size) stamp the data was read at.
+
+        Returns:
+            A read-only view of the new entries (empty when dropped).
+        """
+        self._stored_data = data or {}
+        entries: dict[str, ProviderConfig] = {
+            provider: (
+                value
+                if isinstance(value, dict)
+                # Old format: a bare key string
+                else {"api_key": value, "model": None, "base_url": None}
+            )
+            for provider, value in self._stored_data.items()
+            if not provider.startswith("_")
+        }
+        view: Mapping[str, ProviderConfig] = MappingProxyType(entries)
+        self._entries = view if data is not None else None
+        self._entries_stamp = stamp
+        self._negative = frozenset(VALID_PROVIDERS.difference(view))
+        self._cache = None
+        return view
+
+    def _stored_entries(self) -> Mapping[str, ProviderConfig]:
+        """Return stored provider entries without decrypting them.
+
+        Each entry's ``api_key`` is in its stored form (ciphertext for
+        encrypted files), so only its presence is meaningful; ``model``
+        and ``base_url`` are always plain text. Lookups that only need to
+        know what is configured use this to avoid deriving the encryption
+        key at all.
+
+        The parsed file is cached in memory and reused until the file's
+        inode, mtime, or size changes, so edits made by other processes or
+        KeyManager instances are still picked up.
 
+        Returns:
+            Read-only mapping of provider -> stored ProviderConfig.
+            Empty if the file doesn't exist, is empty, or isn't an object.
+
+        Raises:
+            KeyValidationError: If the keys file contains invalid JSON.
+        """
         try:
-            with self.keys_file.open(encoding="utf-8") as f:
-                data = json.load(f)
+            st = self.keys_file.stat()
+        except FileNotFoundError:
+            return self._set_entries(None, None)
 
-            if not isinstance(data, dict):
-                # Invalid format - return empty dict
-                return {}
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if self._entries is not None and stamp == self._entries_stamp:
+            return self._entries
 
-            # Check if keys are encrypted
+        if st.st_size == 0:
+            # Empty file (e.g. just touched) - nothing stored yet
+            return self._set_entries({}, stamp)
+
+        try:
+            data = _json_loads(self.keys_file.read_bytes())
+        except json.JSONDecodeError as e:
+            raise KeyValidationError(
+                f"Invalid keys file format: {e}. "
+                "The keys.json file appears to be corrupted.\n\n"
+                "Recovery options:\n"
+                "1. If you have a backup, restore ~/.specify/keys.json\n"
+                "2. Otherwise, delete the corrupted file and re-store your keys:\n"
+                "   rm ~/.specify/keys.json\n"
+                "   specify store-key openai YOUR_API_KEY\n\n"
+                f"File location: {self.keys_file}"
+            ) from e
+
+        # Invalid format - treat as empty
+        return self._set_entries(data if isinstance(data, dict) else {}, stamp)
+
+    def _cached_keys(self) -> Mapping[str, ProviderConfig]:
+        """Return the decrypted keys mapping, reloading it from disk if stale.
+
+        Handles both encrypted and plain-text formats for backward compatibility.
+        Also handles old simple-string format and new nested-object format.
+        Migration from old format to new happens automatically on load.
+
+        Decryption happens once per change of the stored entries (see
+        ``_stored_entries``); the result is cached alongside them. The
+        returned mapping is a read-only view of the cache itself, so reads
+        need no defensive copy; use ``_load_keys`` for a mutable copy.
+
+        Returns:
+            Read-only mapping of provider -> ProviderConfig (always decrypted).
+            Empty if the file doesn't exist or is empty.
+
+        Raises:
+            KeyValidationError: If the keys file contains invalid JSON.
+            DecryptionError: If decryption fails (corrupted data, wrong key, etc.).
+        """
+        self._stored_entries()
+        if self._cache is not None:
+            return self._cache
+
+        data = self._stored_data
+
+        try:
+            # Check if keys are encrypted; files written before the KDF was
+            # recorded used PBKDF2
             is_encrypted = data.get("_encrypted", False)
+            kdf = data.get("_kdf", CryptoManager.KDF_PBKDF2)
+            # Before version 4, tokens were base64-encoded a second time
+            wrapped = data.get("_version", 1) < KEYS_FILE_VERSION
+            # Passing the KDF explicitly means only the first decrypt derives
+            # the Fernet key; later entries reuse it with a dict lookup
+            decrypt = self._crypto_manager.decrypt
 
             # Check if we have old format (version 1 or 2 with string values)
             raw_keys: dict[str, Any] = {}
             needs_migration = False
+            # Entries that can't be read stay on disk untouched; a read must
+            # never write back a smaller mapping than it found
+            unreadable = False
 
             for key, value in data.items():
                 # Skip metadata keys (starting with underscore)
@@ -984,13 +1373,13 @@ class KeyManager:
                             decrypted_config: dict[str, Any] = {}
                             for k, v in value.items():
                                 if k == "api_key" and v is not None:
-                                    decrypted_config[k] = self._crypto_manager.decrypt(v)
+                                    decrypted_config[k] = decrypt(v, kdf, wrapped)
                                 else:
                                     decrypted_config[k] = v
                             raw_keys[key] = decrypted_config
                         else:
                             # Old format: decrypt simple string
-                            raw_keys[key] = self._crypto_manager.decrypt(value)
+                            raw_keys[key] = decrypt(value, kdf, wrapped)
                             needs_migration = True
                     except DecryptionError as e:
                         # Re-raise with context about which provider failed
@@ -1004,38 +1393,94 @@ class KeyManager:
                         ) from e
                 else:
                     # Plain text - needs migration to encrypted format
-                    raw_keys[key] = value
                     needs_migration = True
+                    if _looks_like_token(value):
+                        # An unflagged file holding a Fernet token has lost
+                        # its metadata; re-encrypting the token as a key
+                        # would bury the real one
+                        recovered = self._recover_token(key, value)
+                        if recovered is None:
+                            unreadable = True
+                        else:
+                            raw_keys[key] = recovered
+                    else:
+                        raw_keys[key] = value
+
+            # Re-encrypt keys written with a slower (or no longer preferred)
+            # KDF or with the old double base64 encoding
+            if (
+                is_encrypted
+                and raw_keys
+                and (wrapped or kdf != self._crypto_manager.preferred_kdf)
+            ):
+                needs_migration = True
 
             # Migrate to new format if needed
             result = self._migrate_old_format(raw_keys)
 
             # Migrate plain-text keys to encrypted format on next save
             # This happens transparently when keys are saved again
-            if needs_migration and result:
-                # Schedule migration by re-saving with encryption
-                self._save_keys(result)
+            if needs_migration and result and not unreadable:
+                # The upgrade is best-effort: a read-only config directory or
+                # keys file must not stop the keys from being read
+                try:
+                    self._save_keys(result)
+                    return MappingProxyType(result)
+                except (OSError, KeyValidationError) as e:
+                    logger.debug("Could not upgrade %s: %s", self.keys_file, e)
 
-            return result
-        except json.JSONDecodeError as e:
-            raise KeyValidationError(
-                f"Invalid keys file format: {e}. "
-                "The keys.json file appears to be corrupted.\n\n"
-                "Recovery options:\n"
-                "1. If you have a backup, restore ~/.specify/keys.json\n"
-                "2. Otherwise, delete the corrupted file and re-store your keys:\n"
-                "   rm ~/.specify/keys.json\n"
-                "   specify store-key openai YOUR_API_KEY\n\n"
-                f"File location: {self.keys_file}"
-            ) from e
+            self._cache = MappingProxyType(result)
+            return self._cache
         except DecryptionError:
             # Re-raise DecryptionError without wrapping
             raise
 
+    def _recover_token(self, provider: str, value: Any) -> Any | None:
+        """Decrypt a Fernet token found in a keys file missing its metadata.
+
+        The file no longer records which KDF wrote the token, so each one
+        is tried in turn, starting with ``preferred_kdf``.
+
+        Args:
+            provider: The provider the entry is stored under.
+            value: The entry, in either the string or nested format.
+
+        Returns:
+            The entry with its API key decrypted, or None (after logging a
+            warning) if the token can't be decrypted on this machine.
+        """
+        api_key = value.get("api_key") if isinstance(value, dict) else value
+        # Tokens written before KEYS_FILE_VERSION 4 carry an extra base64 layer
+        wrapped = not api_key.startswith("gAAAAA")
+        preferred = self._crypto_manager.preferred_kdf
+        fallback = (
+            CryptoManager.KDF_PBKDF2
+            if preferred == CryptoManager.KDF_HKDF
+            else CryptoManager.KDF_HKDF
+        )
+        for kdf in (preferred, fallback):
+            try:
+                plaintext = self._crypto_manager.decrypt(api_key, kdf, wrapped)
+            except DecryptionError:
+                continue
+            if isinstance(value, dict):
+                return {**value, "api_key": plaintext}
+            return plaintext
+
+        logger.warning(
+            "Skipping undecryptable API key for '%s' in %s. "
+            "Re-store it with: specify config set-key --provider %s",
+            provider,
+            self.keys_file,
+            provider,
+        )
+        return None
+
     def _save_keys(self, keys: dict[str, ProviderConfig]) -> None:
         """Save keys to the JSON file in encrypted format.
 
-        Saves in version 3 format with nested configuration objects.
+        Saves in the current format (``KEYS_FILE_VERSION``) with nested
+        configuration objects.
         Only the api_key is encrypted; model and base_url are stored as plain text.
 
         Args:
@@ -1045,26 +1490,35 @@ class KeyManager:
             PermissionError: If unable to write to the keys file.
             EncryptionError: If encryption fails.
         """
+        # Build everything in sorted key order so the serializer can emit
+        # it as-is, and the cache matches the order a fresh load produces
+        sorted_keys = {provider: keys[provider] for provider in sorted(keys)}
+
         try:
+            # Resolve the KDF once so only the first encrypt derives the
+            # Fernet key; later entries reuse it with a dict lookup
+            kdf = self._crypto_manager.preferred_kdf
+            encrypt = self._crypto_manager.encrypt
+
             # Encrypt each key value before storing
             encrypted_data: dict[str, Any] = {
-                "_version": 3,
                 "_encrypted": True,
+                "_kdf": kdf,
+                "_version": KEYS_FILE_VERSION,
             }
 
-            for provider, config in keys.items():
+            for provider, config in sorted_keys.items():
                 try:
-                    encrypted_config: dict[str, Any] = {}
-
                     # Encrypt api_key if present
-                    if config.get("api_key"):
-                        encrypted_config["api_key"] = self._crypto_manager.encrypt(config["api_key"])
-                    else:
-                        encrypted_config["api_key"] = None
-
-                    # Store model and base_url as plain text (not sensitive)
-                    encrypted_config["model"] = config.get("model")
-                    encrypted_config["base_url"] = config.get("base_url")
+                    api_key = config.get("api_key")
+                    encrypted_config: dict[str, Any] = {
+                        "api_key": (
+                            encrypt(api_key, kdf) if api_key else None
+                        ),
+                        # Store model and base_url as plain text (not sensitive)
+                        "base_url": config.get("base_url"),
+                        "model": config.get("model"),
+                    }
 
                     encrypted_data[provider] = encrypted_config
                 except EncryptionError as e:
@@ -1072,10 +1526,41 @@ class KeyManager:
                         f"Failed to encrypt key for '{provider}': {e}"
                     ) from e
 
-            with self.keys_file.open("w", encoding="utf-8") as f:
-                json.dump(encrypted_data, f, indent=2, sort_keys=True)
-            # Set restrictive permissions: owner read/write only (0600)
-            self.keys_file.chmod(stat.S_IRUSR | stat.S_IWUSR)
+            # Write to a uniquely named sibling temp file, which mkstemp
+            # creates with O_EXCL and owner-only permissions (0600), then
+            # atomically swap it in so readers never observe a truncated or
+            # partially written keys file. The unique name keeps concurrent
+            # writers from clobbering each other's temp files.
+            try:
+                fd, tmp_name = tempfile.mkstemp(
+                    dir=self.config_dir, prefix=".keys.", suffix=".tmp"
+                )
+            except FileNotFoundError:
+                # Config directory was removed since it was last ensured
+                self._config_dir_ready = False
+                self._ensure_config_dir()
+                fd, tmp_name = tempfile.mkstemp(
+                    dir=self.config_dir, prefix=".keys.", suffix=".tmp"
+                )
+            tmp_file = Path(tmp_name)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_json_dumps(encrypted_data))
+                    f.flush()
+                    # Make the contents durable before the rename publishes
+                    # them, so a crash can't leave an empty keys file behind
+                    os.fsync(f.fileno())
+                    # The rename keeps the inode and mtime, so the stamp of
+                    # the temp file is the stamp of the published keys file
+                    st = os.fstat(f.fileno())
+                tmp_file.replace(self.keys_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
+
+            # Keep both caches hot for subsequent reads from this instance
+            self._set_entries(encrypted_data, (st.st_ino, st.st_mtime_ns, st.st_size))
+            self._cache = MappingProxyType(sorted_keys)
         except PermissionError as e:
             raise KeyValidationError(
                 f"Permission denied when writing to {self.keys_file}: {e}"
@@ -1090,13 +1575,23 @@ class KeyManager:
         Creates the directory if it doesn't exist and sets permissions to 0700
         (owner read, write, execute only) to prevent access by other users.
 
+        This runs at most once per instance; subsequent calls return
+        immediately.
+
         Raises:
             PermissionError: If unable to create the directory.
         """
+        if self._config_dir_ready:
+            return
+
         try:
-            self.config_dir.mkdir(parents=True, exist_ok=True)
-            # Set restrictive permissions: owner read/write/execute only (0700)
+            # Create with 0700 so there is no window where a fresh directory
+            # is group/world-accessible; mkdir's mode is filtered by the
+            # umask, so still chmod to enforce exactly owner
+            # read/write/execute (0700) on new and pre-existing directories
+            self.config_dir.mkdir(mode=stat.S_IRWXU, parents=True, exist_ok=True)
             self.config_dir.chmod(stat.S_IRWXU)
+            self._config_dir_ready = True
         except PermissionError as e:
             raise KeyValidationError(
                 f"Permission denied when creating config directory {self.config_dir}: {e}"
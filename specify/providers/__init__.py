@@ -7,6 +7,10 @@ This module contains LLM provider clients:
 - openai.py: OpenAI client
 - anthropic.py: Anthropic client
 
+Provider classes are resolved lazily (PEP 562) and registered with the
+default factory by import path, so importing ``specify.providers`` does not
+load any provider SDK until a provider is created or its class is accessed.
+
 Example usage:
     >>> from specify.providers import ProviderConfig, get_default_factory
     >>> config = ProviderConfig.from_env("openai", "gpt-4")
@@ -16,6 +20,8 @@ Example usage:
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Final
+
 from specify.providers.base import (
     BaseProvider,
     ProviderAuthError,
@@ -29,12 +35,19 @@ from specify.providers.base import (
     ProviderResponseError,
     get_default_factory,
 )
+from specify.utils.lazy import lazy_attrs
 
-from specify.providers.ollama import OllamaProvider
+if TYPE_CHECKING:
+    from specify.providers.ollama import OllamaProvider
+
+# Public provider class name -> submodule that defines it
+_LAZY_ATTRS: Final[dict[str, str]] = {
+    "OllamaProvider": "ollama",
+}
 
 # Explicitly register providers with the default factory
 # This ensures importing the submodule is side-effect-free
-get_default_factory().register("ollama", OllamaProvider)
+get_default_factory().register_lazy("ollama", "specify.providers.ollama:OllamaProvider")
 
 __all__ = [
     "BaseProvider",
@@ -50,3 +63,6 @@ __all__ = [
     "ProviderResponseError",
     "get_default_factory",
 ]
+
+# Module-level __getattr__/__dir__ hooks (PEP 562)
+__getattr__, __dir__ = lazy_attrs(__name__, _LAZY_ATTRS, globals())
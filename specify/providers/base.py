@@ -14,8 +14,8 @@ Example usage:
 
 from __future__ import annotations
 
+import importlib
 import os
-import threading
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -32,6 +32,12 @@ _PROVIDER_ENV_VAR_MAPPING: dict[str, str] = {
     "ollama": "OLLAMA_HOST",
 }
 
+# Providers whose environment variable holds a base URL rather than an API
+# key, with the URL to use when it is unset
+_PROVIDER_DEFAULT_BASE_URL: dict[str, str] = {
+    "ollama": "http://localhost:11434",
+}
+
 
 # =============================================================================
 # Provider Exceptions
@@ -188,7 +194,8 @@ class ProviderConfig(BaseModel):
             >>> config = ProviderConfig.from_env("openai", "gpt-4")
             >>> # Reads OPENAI_API_KEY from environment
         """
-        env_var_name = _PROVIDER_ENV_VAR_MAPPING.get(provider_name.lower())
+        name_lower = provider_name.lower()
+        env_var_name = _PROVIDER_ENV_VAR_MAPPING.get(name_lower)
 
         if env_var_name is None:
             raise ProviderConfigError(
@@ -197,8 +204,9 @@ class ProviderConfig(BaseModel):
             )
 
         # For ollama, we use OLLAMA_HOST as the base URL, not api_key
-        if provider_name.lower() == "ollama":
-            base_url = os.environ.get(env_var_name, "http://localhost:11434")
+        default_base_url = _PROVIDER_DEFAULT_BASE_URL.get(name_lower)
+        if default_base_url is not None:
+            base_url = os.environ.get(env_var_name, default_base_url)
             return cls(model=model, base_url=base_url, timeout=60, max_retries=3)
 
         api_key = os.environ.get(env_var_name)
@@ -342,8 +350,12 @@ class ProviderFactory:
     This class implements a registry pattern for providers, allowing
     dynamic registration and creation of provider clients.
 
+    Providers can be registered by class, or by import path with
+    ``register_lazy`` so their SDKs are only imported on first ``create``.
+
     Attributes:
-        _registry: Dictionary mapping provider names to provider classes
+        _registry: Dictionary mapping provider names to provider classes,
+            or to "module:attr" import paths not yet resolved
 
     Example:
         >>> from specify.providers import ProviderFactory, ProviderConfig
@@ -357,7 +369,7 @@ class ProviderFactory:
 
     def __init__(self) -> None:
         """Initialize the provider factory with an empty registry."""
-        self._registry: dict[str, type[BaseProvider]] = {}
+        self._registry: dict[str, type[BaseProvider] | str] = {}
 
     def register(self, name: str, provider_class: type[BaseProvider]) -> None:
         """Register a provider class with the factory.
@@ -367,7 +379,8 @@ class ProviderFactory:
             provider_class: Provider class to register
 
         Raises:
-            ProviderConfigError: If a provider with this name is already registered
+            ProviderConfigError: If a provider with this name is already
+                registered, or if ``provider_class`` is not a BaseProvider subclass
 
         Example:
             >>> factory.register("openai", OpenAIProvider)
@@ -379,14 +392,52 @@ class ProviderFactory:
                 f"Use a different name or unregister first."
             )
 
-        if not issubclass(provider_class, BaseProvider):
+        # issubclass() raises TypeError for non-classes, so check for a type first
+        if not (
+            isinstance(provider_class, type)
+            and issubclass(provider_class, BaseProvider)
+        ):
             raise ProviderConfigError(
                 f"Provider class must be a subclass of BaseProvider, "
-                f"got {provider_class.__name__}"
+                f"got {getattr(provider_class, '__name__', repr(provider_class))}"
             )
 
         self._registry[name_lower] = provider_class
 
+    def register_lazy(self, name: str, import_path: str) -> None:
+        """Register a provider by import path, deferring its import.
+
+        The provider module is imported the first time ``create`` is called
+        for this name; the resolved class then replaces the path.
+
+        Args:
+            name: Provider name (e.g., "openai", "anthropic", "ollama")
+            import_path: Location of the provider class as "module:attr"
+
+        Raises:
+            ProviderConfigError: If a provider with this name is already
+                registered, or if ``import_path`` is not "module:attr"
+
+        Example:
+            >>> factory.register_lazy(
+            ...     "ollama", "specify.providers.ollama:OllamaProvider"
+            ... )
+        """
+        name_lower = name.lower()
+        if name_lower in self._registry:
+            raise ProviderConfigError(
+                f"Provider '{name}' is already registered. "
+                f"Use a different name or unregister first."
+            )
+
+        module_name, _, attr = import_path.partition(":")
+        if not module_name or not attr:
+            raise ProviderConfigError(
+                f"Provider import path must be 'module:attr', got '{import_path}'"
+            )
+
+        self._registry[name_lower] = import_path
+
     def unregister(self, name: str) -> None:
         """Unregister a provider from the factory.
 
@@ -399,10 +450,8 @@ class ProviderFactory:
         Example:
             >>> factory.unregister("openai")
         """
-        name_lower = name.lower()
-        if name_lower not in self._registry:
+        if self._registry.pop(name.lower(), None) is None:
             raise ProviderConfigError(f"Provider '{name}' is not registered")
-        del self._registry[name_lower]
 
     def create(self, name: str, config: ProviderConfig) -> BaseProvider:
         """Create a provider instance.
@@ -422,16 +471,52 @@ class ProviderFactory:
             >>> provider = factory.create("openai", config)
         """
         name_lower = name.lower()
-        if name_lower not in self._registry:
+        provider_class = self._registry.get(name_lower)
+        if provider_class is None:
             available = self.get_available_providers()
             raise ProviderConfigError(
                 f"Provider '{name}' is not registered. "
                 f"Available providers: {available}"
             )
 
-        provider_class = self._registry[name_lower]
+        if isinstance(provider_class, str):
+            provider_class = self._resolve(name_lower, provider_class)
         return provider_class(config)
 
+    def _resolve(self, name_lower: str, import_path: str) -> type[BaseProvider]:
+        """Import a lazily registered provider class and memoize it.
+
+        Args:
+            name_lower: Lowercase provider name the path is registered under
+            import_path: Location of the provider class as "module:attr"
+
+        Returns:
+            The provider class
+
+        Raises:
+            ProviderConfigError: If the class cannot be imported or is not a
+                subclass of BaseProvider
+        """
+        module_name, _, attr = import_path.partition(":")
+        try:
+            provider_class = getattr(importlib.import_module(module_name), attr)
+        except (ImportError, AttributeError) as e:
+            raise ProviderConfigError(
+                f"Cannot load provider '{name_lower}' from {import_path}: {e}"
+            ) from e
+
+        if not (
+            isinstance(provider_class, type)
+            and issubclass(provider_class, BaseProvider)
+        ):
+            raise ProviderConfigError(
+                f"Provider class must be a subclass of BaseProvider, "
+                f"got {import_path}"
+            )
+
+        self._registry[name_lower] = provider_class
+        return provider_class
+
     def get_available_providers(self) -> list[str]:
         """Get list of registered provider names.
 
@@ -464,8 +549,9 @@ class ProviderFactory:
 # Global Factory Singleton
 # =============================================================================
 
-_default_factory: ProviderFactory | None = None
-_factory_lock = threading.Lock()
+# Created at import, which the import lock makes thread-safe; constructing
+# an empty factory is cheap enough not to defer
+_default_factory: ProviderFactory = ProviderFactory()
 
 
 def get_default_factory() -> ProviderFactory:
@@ -481,9 +567,4 @@ def get_default_factory() -> ProviderFactory:
         >>> factory = get_default_factory()
         >>> factory.register("openai", OpenAIProvider)
     """
-    global _default_factory
-    if _default_factory is None:
-        with _factory_lock:
-            if _default_factory is None:
-                _default_factory = ProviderFactory()
     return _default_factory
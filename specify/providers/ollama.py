@@ -14,6 +14,7 @@ Example usage:
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 # Default host for local Ollama instance
@@ -31,6 +32,23 @@ from specify.providers.base import (
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+# Error message fragments that indicate the Ollama server couldn't be reached
+CONNECTION_ERROR_KEYWORDS: tuple[str, ...] = (
+    "connection",
+    "refused",
+    "timeout",
+    "unreachable",
+    "network",
+    "dns",
+    "host not found",
+    "name or service not known",
+)
+
+# All keywords in one case-insensitive alternation, so a message is scanned once
+_CONNECTION_ERROR_RE = re.compile(
+    "|".join(map(re.escape, CONNECTION_ERROR_KEYWORDS)), re.IGNORECASE
+)
+
 
 class OllamaProvider(BaseProvider):
     """Ollama provider for local LLM inference.
@@ -126,7 +144,11 @@ class OllamaProvider(BaseProvider):
                 stream=True,
             )
             async for chunk in response:
-                yield chunk["message"]["content"]
+                # The final chunk (and tool-call chunks) can carry no text;
+                # skip them rather than yield "" or None to the consumer
+                content = chunk["message"]["content"]
+                if content:
+                    yield content
         except Exception as e:
             self._handle_error(e)
             raise
@@ -186,20 +208,8 @@ class OllamaProvider(BaseProvider):
             ProviderConnectionError: For connection-related errors.
             ProviderResponseError: For response-related errors.
         """
-        error_message = str(error).lower()
-
         # Check for common connection errors
-        connection_keywords = [
-            "connection",
-            "refused",
-            "timeout",
-            "unreachable",
-            "network",
-            "dns",
-            "host not found",
-            "name or service not known",
-        ]
-        if any(keyword in error_message for keyword in connection_keywords):
+        if _CONNECTION_ERROR_RE.search(str(error)):
             raise ProviderConnectionError(
                 f"Failed to connect to Ollama at {self._config.base_url}: {error}"
             ) from error
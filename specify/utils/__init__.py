@@ -2,6 +2,7 @@
 Utilities module for Specify.AI.
 
 This module contains shared utility functions:
+- lazy.py: Lazy (PEP 562) attribute loading for packages
 - logging.py: Structured logging setup using structlog
 - validation.py: Input validation helpers
 - retry.py: Retry logic with exponential backoff
@@ -0,0 +1,59 @@
+"""
+Lazy attribute loading for Specify.AI packages.
+
+Packages whose public names live in submodules with heavy dependencies
+(``specify.core`` and cryptography, ``specify.providers`` and the provider
+SDKs) use this to resolve those names on first access (PEP 562), so that
+importing the package itself stays cheap.
+
+Example usage:
+    >>> _LAZY_ATTRS = {"KeyManager": "key_manager"}
+    >>> __getattr__, __dir__ = lazy_attrs(__name__, _LAZY_ATTRS, globals())
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+__all__ = ["lazy_attrs"]
+
+
+def lazy_attrs(
+    package: str, attrs: Mapping[str, str], namespace: dict[str, Any]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` hooks for a package.
+
+    Args:
+        package: The package's ``__name__``.
+        attrs: Public name -> submodule (relative to ``package``) defining it.
+        namespace: The package's ``globals()``; resolved names are cached
+            here so each is imported at most once.
+
+    Returns:
+        A ``(__getattr__, __dir__)`` pair to assign at module level.
+    """
+
+    def __getattr__(name: str) -> Any:
+        """Import a public name from its submodule on first access.
+
+        Raises:
+            AttributeError: If ``name`` is not a lazily loaded name of
+                ``package``.
+        """
+        submodule = attrs.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(f"{package}.{submodule}"), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        """List the package's names, including lazy ones not yet imported."""
+        return sorted({*namespace, *namespace.get("__all__", ()), *attrs})
+
+    return __getattr__, __dir__
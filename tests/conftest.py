@@ -7,10 +7,14 @@ This module provides shared fixtures for testing:
 - mock_ollama_response: Mock response from Ollama API
 - mock_openai_response: Mock response from OpenAI API
 - mock_anthropic_response: Mock response from Anthropic API
+- run_isolated: Run Python code in a fresh interpreter
 """
 
 from __future__ import annotations
 
+import subprocess
+import sys
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -70,7 +74,8 @@ def temp_output_dir(tmp_path: Path) -> Path:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@pytest.fixture
+# Prompts are immutable strings, so one instance serves the whole session
+@pytest.fixture(scope="session")
 def sample_prompt() -> str:
     """
     Sample product prompt for testing.
@@ -85,7 +90,7 @@ def sample_prompt() -> str:
     return "Build a simple task management app with user authentication"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_long_prompt() -> str:
     """
     Long sample product prompt for testing.
@@ -118,6 +123,7 @@ def sample_long_prompt() -> str:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+# These stay function-scoped: each test gets its own dict and may mutate it
 @pytest.fixture
 def mock_ollama_response() -> dict[str, object]:
     """
@@ -278,11 +284,14 @@ A task management application with a client-server architecture.
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner() -> pytest.CliRunner:
     """
     Create a Click CLI test runner.
 
+    The runner is shared by the whole session: it holds no per-invocation
+    state, and each ``invoke`` sets up its own isolated streams and env.
+
     Returns:
         A Click CliRunner instance for testing CLI commands.
 
@@ -297,28 +306,38 @@ def cli_runner() -> pytest.CliRunner:
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Configuration Markers
+# Subprocess Fixtures
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def pytest_configure(config: pytest.Config) -> None:
+@pytest.fixture(scope="session")
+def run_isolated() -> Callable[..., subprocess.CompletedProcess[str]]:
     """
-    Configure custom pytest markers.
+    Run Python code in a fresh interpreter and check that it succeeds.
 
-    This function registers custom markers used in the test suite.
+    Import-deferral tests need a clean ``sys.modules``, which the test
+    process can't provide once any test has imported the package.
 
-    Args:
-        config: The pytest configuration object.
+    Returns:
+        A function taking the code, extra ``sys.argv`` items, and an
+        optional ``env``. It runs the code with ``python -c``, asserts a
+        zero exit status, and returns the completed process.
+
+    Example:
+        >>> def test_lazy_import(run_isolated):
+        ...     run_isolated("import specify.core")
     """
-    config.addinivalue_line(
-        "markers",
-        "slow: marks tests as slow (deselect with '-m \"not slow\"')",
-    )
-    config.addinivalue_line(
-        "markers",
-        "integration: marks tests as integration tests",
-    )
-    config.addinivalue_line(
-        "markers",
-        "unit: marks tests as unit tests",
-    )
+
+    def run(
+        code: str, *args: str, env: dict[str, str] | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        result = subprocess.run(
+            [sys.executable, "-c", code, *args],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        assert result.returncode == 0, result.stderr
+        return result
+
+    return run
@@ -13,6 +13,9 @@ This module contains tests for:
 
 from __future__ import annotations
 
+import subprocess
+from collections.abc import Callable
+
 import pytest
 from click.testing import CliRunner
 from unittest import mock
@@ -184,14 +187,15 @@ class TestGenerateCommand:
         assert result.exit_code != 0
         assert "invalid" in result.output.lower() or "choice" in result.output.lower()
 
-    def test_generate_invalid_provider(self, cli_runner: CliRunner) -> None:
+    def test_generate_invalid_provider(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test generate with invalid provider."""
-        result = cli_runner.invoke(
-            cli,
-            ["generate", "--prompt", "Build a task app", "--provider", "invalid"],
-        )
+        monkeypatch.setenv("SPECIFY_CONFIG_DIR", str(temp_config_dir))
 
-        assert result.exit_code != 0
+        exit_code = main(["generate", "--prompt", "Build a task app", "--provider", "invalid"])
+
+        assert exit_code != 0
 
     def test_generate_no_consistency_check_flag(self, cli_runner: CliRunner) -> None:
         """Test generate with --no-consistency-check flag skips consistency check."""
@@ -279,17 +283,21 @@ class TestConfigCommand:
         assert "--provider" in result.output
         assert "--key" in result.output
 
-    def test_config_set_key_requires_provider(self, cli_runner: CliRunner) -> None:
+    def test_config_set_key_requires_provider(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that set-key requires provider."""
-        result = cli_runner.invoke(cli, ["config", "set-key", "--key", "test-key"])
+        monkeypatch.setenv("SPECIFY_CONFIG_DIR", str(temp_config_dir))
 
-        assert result.exit_code != 0
+        assert main(["config", "set-key", "--key", "test-key"]) != 0
 
-    def test_config_set_key_requires_key(self, cli_runner: CliRunner) -> None:
+    def test_config_set_key_requires_key(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that set-key requires key."""
-        result = cli_runner.invoke(cli, ["config", "set-key", "--provider", "openai"])
+        monkeypatch.setenv("SPECIFY_CONFIG_DIR", str(temp_config_dir))
 
-        assert result.exit_code != 0
+        assert main(["config", "set-key", "--provider", "openai"]) != 0
 
     def test_config_list_keys_empty(
         self, cli_runner: CliRunner, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
@@ -451,6 +459,76 @@ class TestPackageImport:
         assert specify.utils is not None
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Lazy Subcommand Loading Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestLazyGroup:
+    """Tests for lazy subcommand resolution on the top-level group."""
+
+    def test_list_commands_includes_lazy_subcommands(self) -> None:
+        """Test that lazy subcommands are listed without being registered."""
+        ctx = click.Context(cli)
+
+        assert cli.list_commands(ctx) == [
+            "check-consistency",
+            "config",
+            "fix-inconsistencies",
+            "generate",
+        ]
+
+    def test_get_command_caches_resolved_command(self) -> None:
+        """Test that a lazy subcommand is imported once and then reused."""
+        from specify.commands.generate import generate
+
+        ctx = click.Context(cli)
+
+        first = cli.get_command(ctx, "generate")
+        second = cli.get_command(ctx, "generate")
+
+        assert first is generate
+        assert second is first
+
+    def test_get_command_unknown_returns_none(self) -> None:
+        """Test that unknown command names fall through to Click's lookup."""
+        ctx = click.Context(cli)
+
+        assert cli.get_command(ctx, "does-not-exist") is None
+
+    def test_version_does_not_import_subcommands(
+        self, run_isolated: Callable[..., subprocess.CompletedProcess[str]]
+    ) -> None:
+        """Test that --version resolves without importing command modules."""
+        code = (
+            "import sys\n"
+            "from specify.cli import main\n"
+            "main(['--version'])\n"
+            "assert 'specify.commands.generate' not in sys.modules\n"
+            "assert 'specify.core.key_manager' not in sys.modules\n"
+        )
+        result = run_isolated(code)
+
+        assert "specify-ai, version" in result.stdout
+
+    def test_module_version_skips_click(
+        self, run_isolated: Callable[..., subprocess.CompletedProcess[str]]
+    ) -> None:
+        """Test that python -m specify --version answers without importing Click."""
+        code = (
+            "import runpy, sys\n"
+            "sys.argv = ['specify', '--version']\n"
+            "try:\n"
+            "    runpy.run_module('specify', run_name='__main__')\n"
+            "except SystemExit as e:\n"
+            "    assert e.code == 0\n"
+            "assert 'click' not in sys.modules\n"
+        )
+        result = run_isolated(code)
+
+        assert result.stdout == f"specify-ai, version {__version__}\n"
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Edge Case Tests
 # ─────────────────────────────────────────────────────────────────────────────
@@ -476,68 +554,66 @@ class TestEdgeCases:
 
         assert result.exit_code == 0
 
-    def test_generate_each_type(self, cli_runner: CliRunner) -> None:
-        """Test generate with each document type."""
-        doc_types = ["app-flow", "bdd", "design-doc", "prd", "tech-arch"]
-
-        for doc_type in doc_types:
-            result = cli_runner.invoke(
-                cli,
-                ["generate", "--prompt", "Build a task app", "--type", doc_type],
-            )
-            assert result.exit_code == 0, f"Failed for type: {doc_type}"
-
-    def test_generate_each_provider(self, cli_runner: CliRunner) -> None:
-        """Test generate with each provider."""
-        providers = ["ollama", "openai", "anthropic"]
-
-        for provider in providers:
-            result = cli_runner.invoke(
-                cli,
-                [
-                    "generate",
-                    "--prompt",
-                    "Build a task app",
-                    "--type",
-                    "prd",
-                    "--provider",
-                    provider,
-                ],
-            )
-            assert result.exit_code == 0, f"Failed for provider: {provider}"
+    @pytest.mark.parametrize("provider", ["ollama", "openai", "anthropic"])
+    @pytest.mark.parametrize(
+        "doc_type", ["app-flow", "bdd", "design-doc", "prd", "tech-arch"]
+    )
+    def test_generate_each_type_and_provider(
+        self, cli_runner: CliRunner, doc_type: str, provider: str
+    ) -> None:
+        """Test generate with every document type and provider combination."""
+        result = cli_runner.invoke(
+            cli,
+            [
+                "generate",
+                "--prompt",
+                "Build a task app",
+                "--type",
+                doc_type,
+                "--provider",
+                provider,
+            ],
+        )
+        assert result.exit_code == 0
 
-    def test_config_set_key_each_provider(self, cli_runner: CliRunner) -> None:
+    @pytest.mark.parametrize("provider", ["ollama", "openai", "anthropic"])
+    def test_config_set_key_each_provider(
+        self,
+        cli_runner: CliRunner,
+        temp_config_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        provider: str,
+    ) -> None:
         """Test config set-key with each provider."""
-        providers = ["ollama", "openai", "anthropic"]
+        # Keep the CLI away from the real ~/.specify
+        monkeypatch.setenv("SPECIFY_CONFIG_DIR", str(temp_config_dir))
 
-        for provider in providers:
-            result = cli_runner.invoke(
-                cli,
-                ["config", "set-key", "--provider", provider, "--key", "test-key"],
-            )
-            assert result.exit_code == 0, f"Failed for provider: {provider}"
+        result = cli_runner.invoke(
+            cli,
+            ["config", "set-key", "--provider", provider, "--key", "test-key"],
+        )
+        assert result.exit_code == 0
 
+    @pytest.mark.parametrize("provider", ["ollama", "openai", "anthropic"])
     def test_config_delete_key_each_provider(
-        self, cli_runner: CliRunner, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        cli_runner: CliRunner,
+        temp_config_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        provider: str,
     ) -> None:
-        """Test config delete-key with each provider after storing keys."""
-        providers = ["ollama", "openai", "anthropic"]
-
-        # Set up keys using KeyManager with temp directory
-        key_manager = KeyManager(config_dir=temp_config_dir)
-        for provider in providers:
-            key_manager.store_key(provider, f"test-key-{provider}")
+        """Test config delete-key with each provider after storing its key."""
+        # Set up the key using KeyManager with temp directory
+        KeyManager(config_dir=temp_config_dir).store_key(provider, f"test-key-{provider}")
 
         # Set environment variable so CLI uses the same config directory
         monkeypatch.setenv("SPECIFY_CONFIG_DIR", str(temp_config_dir))
 
-        # Now delete each key via CLI
-        for provider in providers:
-            result = cli_runner.invoke(
-                cli,
-                ["config", "delete-key", "--provider", provider],
-            )
-            assert result.exit_code == 0, f"Failed for provider: {provider}"
+        result = cli_runner.invoke(
+            cli,
+            ["config", "delete-key", "--provider", provider],
+        )
+        assert result.exit_code == 0
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -15,12 +15,24 @@ Tests use the temp_config_dir fixture from conftest.py for isolated testing.
 
 from __future__ import annotations
 
+import base64
 import json
+import os
+import shutil
+import stat
+import subprocess
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
-from specify.core import CryptoManager, KeyManager, KeyNotFoundError, KeyValidationError
+from specify.core import (
+    CryptoManager,
+    DecryptionError,
+    KeyManager,
+    KeyNotFoundError,
+    KeyValidationError,
+)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Test Fixtures
@@ -124,6 +136,25 @@ class TestStoreKey:
         with pytest.raises(KeyValidationError, match="API key is required"):
             key_manager.store_key("openai", "   ")
 
+    def test_store_keys_bulk(self, key_manager: KeyManager) -> None:
+        """Test storing several keys in one call."""
+        key_manager.store_key("openai", "sk-old", model="gpt-4")
+
+        key_manager.store_keys({"OpenAI": " sk-new ", "anthropic": "sk-ant-xyz"})
+
+        assert key_manager.get_key("openai") == "sk-new"
+        assert key_manager.get_key("anthropic") == "sk-ant-xyz"
+        assert key_manager.get_provider_config("openai")["model"] == "gpt-4"
+
+    def test_store_keys_invalid_entry_writes_nothing(
+        self, key_manager: KeyManager
+    ) -> None:
+        """Test that one invalid entry rejects the whole batch."""
+        with pytest.raises(KeyValidationError, match="Invalid provider"):
+            key_manager.store_keys({"openai": "sk-test", "invalid": "key"})
+
+        assert key_manager.list_providers() == []
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Get Key Tests
@@ -315,6 +346,187 @@ class TestCryptoManager:
         # The secret should NOT appear in plain text
         assert "sk-secret-key-12345" not in content
 
+    def test_derived_key_shared_across_instances(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a second instance reuses the derived key."""
+        CryptoManager(temp_config_dir).encrypt("test")
+
+        def fail_kdf(*args: object, **kwargs: object) -> None:
+            raise AssertionError("key derivation should be cached")
+
+        monkeypatch.setattr(
+            "cryptography.hazmat.primitives.kdf.pbkdf2.PBKDF2HMAC", fail_kdf
+        )
+        monkeypatch.setattr("cryptography.hazmat.primitives.kdf.hkdf.HKDF", fail_kdf)
+
+        assert CryptoManager(temp_config_dir).encrypt("test")
+
+    def test_preferred_kdf(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that HKDF is preferred unless only the fallback ID is available."""
+        crypto = CryptoManager(temp_config_dir)
+        monkeypatch.setattr(crypto, "_get_machine_id", lambda: b"machine-uuid")
+        assert crypto.preferred_kdf == CryptoManager.KDF_HKDF
+
+        weak = CryptoManager(temp_config_dir)
+        monkeypatch.setattr(CryptoManager, "_machine_ids", {})
+        monkeypatch.setattr("specify.core.key_manager.platform.system", lambda: "Plan9")
+        with pytest.warns(UserWarning, match="insecure fallback"):
+            assert weak.preferred_kdf == CryptoManager.KDF_PBKDF2
+
+    def test_macos_machine_id_parsed_from_ioreg(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the IOPlatformUUID is extracted from ioreg output."""
+        stdout = (
+            '+-o J314sAP  <class IOPlatformExpertDevice>\n'
+            '    {\n'
+            '      "IOPlatformSerialNumber" = "C02XXXXXXXXX"\n'
+            '      "IOPlatformUUID" = "1A2B3C4D-0000-1111-2222-333344445555"\n'
+            '    }\n'
+        )
+        monkeypatch.setattr(
+            "specify.core.key_manager.subprocess.run",
+            lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout, ""),
+        )
+
+        machine_id = CryptoManager(temp_config_dir)._get_macos_machine_id()
+
+        assert machine_id == b"1A2B3C4D-0000-1111-2222-333344445555"
+
+    def test_machine_id_probed_once(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the machine ID is probed once and shared across instances."""
+        monkeypatch.setattr(CryptoManager, "_machine_ids", {})
+        monkeypatch.setattr("specify.core.key_manager.platform.system", lambda: "Plan9")
+        probes: list[int] = []
+        original = CryptoManager._get_fallback_machine_id
+
+        def counting_probe(self: CryptoManager) -> bytes:
+            probes.append(1)
+            return original(self)
+
+        monkeypatch.setattr(CryptoManager, "_get_fallback_machine_id", counting_probe)
+
+        with pytest.warns(UserWarning, match="insecure fallback"):
+            first = CryptoManager(temp_config_dir)._get_machine_id()
+        second = CryptoManager(temp_config_dir)
+        assert second._get_machine_id() == first
+        assert len(probes) == 1
+        # The weak-ID flag travels with the cached value
+        assert second.preferred_kdf == CryptoManager.KDF_PBKDF2
+
+    def test_legacy_pbkdf2_keys_are_migrated(self, temp_config_dir: Path) -> None:
+        """Test that version 3 keys (PBKDF2, double base64) are re-encrypted."""
+        crypto = CryptoManager(temp_config_dir)
+        token = crypto.encrypt("sk-legacy-123", CryptoManager.KDF_PBKDF2)
+        legacy = {
+            "_encrypted": True,
+            "_version": 3,
+            "openai": {
+                "api_key": base64.urlsafe_b64encode(token.encode()).decode(),
+                "base_url": None,
+                "model": None,
+            },
+        }
+        keys_file = temp_config_dir / "keys.json"
+        keys_file.write_text(json.dumps(legacy), encoding="utf-8")
+
+        km = KeyManager(config_dir=temp_config_dir)
+        assert km.get_key("openai") == "sk-legacy-123"
+
+        data = json.loads(keys_file.read_text(encoding="utf-8"))
+        assert data["_kdf"] == CryptoManager.KDF_HKDF
+        assert data["_version"] == 4
+        assert data["openai"]["api_key"].startswith("gAAAAA")
+        reloaded = KeyManager(config_dir=temp_config_dir)
+        assert reloaded.get_key("openai") == "sk-legacy-123"
+
+    def test_version3_keys_readable_in_read_only_dir(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that version 3 (double base64) keys load when the dir is read-only."""
+        token = CryptoManager(temp_config_dir).encrypt("sk-legacy-123")
+        keys_file = temp_config_dir / "keys.json"
+        keys_file.write_text(
+            json.dumps(
+                {
+                    "_encrypted": True,
+                    "_kdf": CryptoManager.KDF_HKDF,
+                    "_version": 3,
+                    "openai": {
+                        "api_key": base64.urlsafe_b64encode(token.encode()).decode(),
+                        "base_url": None,
+                        "model": None,
+                    },
+                }
+            ),
+            encoding="utf-8",
+        )
+        original = keys_file.read_bytes()
+        temp_config_dir.chmod(0o500)
+
+        def deny(*args: object, **kwargs: object) -> None:
+            raise PermissionError(13, "Permission denied")
+
+        # chmod alone doesn't stop root, so deny the temp file as well
+        monkeypatch.setattr("specify.core.key_manager.tempfile.mkstemp", deny)
+
+        try:
+            km = KeyManager(config_dir=temp_config_dir)
+            assert km.get_key("openai") == "sk-legacy-123"
+        finally:
+            temp_config_dir.chmod(0o700)
+
+        assert keys_file.read_bytes() == original
+
+    def test_pbkdf2_keys_readable_when_upgrade_fails(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a failed KDF upgrade still returns the stored keys."""
+        token = CryptoManager(temp_config_dir).encrypt(
+            "sk-legacy-123", CryptoManager.KDF_PBKDF2
+        )
+        keys_file = temp_config_dir / "keys.json"
+        keys_file.write_text(
+            json.dumps(
+                {
+                    "_encrypted": True,
+                    "_kdf": CryptoManager.KDF_PBKDF2,
+                    "_version": 4,
+                    "openai": {"api_key": token, "base_url": None, "model": None},
+                }
+            ),
+            encoding="utf-8",
+        )
+        original = keys_file.read_bytes()
+
+        def deny(*args: object, **kwargs: object) -> None:
+            raise PermissionError(13, "Permission denied")
+
+        # Stands in for an unwritable config directory, which root ignores
+        monkeypatch.setattr("specify.core.key_manager.tempfile.mkstemp", deny)
+
+        km = KeyManager(config_dir=temp_config_dir)
+        assert km.get_key("openai") == "sk-legacy-123"
+        assert km.list_keys()["openai"]
+        assert keys_file.read_bytes() == original
+
+    def test_derived_key_not_shared_across_machines(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a different machine ID cannot decrypt existing data."""
+        encrypted = CryptoManager(temp_config_dir).encrypt("test")
+
+        other = CryptoManager(temp_config_dir)
+        monkeypatch.setattr(other, "_get_machine_id", lambda: b"another-machine")
+
+        with pytest.raises(DecryptionError):
+            other.decrypt(encrypted)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Integration Tests
@@ -373,7 +585,7 @@ class TestKeyManagerIntegration:
 
         assert isinstance(data, dict)
         assert data.get("_encrypted") is True
-        assert data.get("_version") == 3
+        assert data.get("_version") == 4
         # The actual key should be encrypted in nested format
         assert data.get("openai") is not None
         assert isinstance(data.get("openai"), dict)
@@ -383,8 +595,47 @@ class TestKeyManagerIntegration:
         assert "model" in data.get("openai")
         # The api_key should be encrypted (not plain-text)
         assert data.get("openai").get("api_key") != "sk-test123"
-        # Encrypted tokens are base64-encoded (starts with 'Z' due to double encoding)
-        assert data.get("openai").get("api_key").startswith("Z")
+        # Encrypted values are stored as raw Fernet tokens
+        assert data.get("openai").get("api_key").startswith("gAAAAA")
+
+    def test_json_keys_sorted(self, key_manager: KeyManager) -> None:
+        """Test that providers and their fields are written in sorted order."""
+        key_manager.store_key("openai", "sk-test123")
+        key_manager.store_key("anthropic", "sk-ant-test", model="claude")
+
+        with key_manager.keys_file.open(encoding="utf-8") as f:
+            data = json.load(f)
+
+        assert list(data) == sorted(data)
+        assert list(data["anthropic"]) == sorted(data["anthropic"])
+
+    def test_save_is_atomic_and_owner_only(self, key_manager: KeyManager) -> None:
+        """Test that saving leaves no temp file and restricts permissions."""
+        key_manager.store_key("openai", "sk-test123")
+
+        keys_file = key_manager.keys_file
+        assert list(key_manager.config_dir.glob(".keys.*.tmp")) == []
+        assert stat.S_IMODE(keys_file.stat().st_mode) == 0o600
+
+    def test_other_writers_temp_file_untouched(self, key_manager: KeyManager) -> None:
+        """Test that a save doesn't reuse or remove another writer's temp file."""
+        key_manager.config_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = key_manager.config_dir / ".keys.inflight.tmp"
+        tmp_file.write_text("partial", encoding="utf-8")
+        tmp_file.chmod(0o644)
+
+        key_manager.store_key("openai", "sk-test123")
+
+        assert tmp_file.read_text(encoding="utf-8") == "partial"
+        assert stat.S_IMODE(key_manager.keys_file.stat().st_mode) == 0o600
+        assert key_manager.get_key("openai") == "sk-test123"
+
+    def test_config_dir_owner_only(self, tmp_path: Path) -> None:
+        """Test that a newly created config directory is owner-only (0700)."""
+        km = KeyManager(config_dir=tmp_path / "specify")
+        km.store_key("openai", "sk-test123")
+
+        assert stat.S_IMODE(km.config_dir.stat().st_mode) == 0o700
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -417,6 +668,65 @@ class TestBackwardCompatibility:
             data = json.load(f)
         assert data.get("_encrypted") is True
 
+    def test_unflagged_tokens_recovered(self, temp_config_dir: Path) -> None:
+        """Test that tokens in a file missing its metadata are decrypted."""
+        token = CryptoManager(temp_config_dir).encrypt("sk-test123")
+        keys_file = temp_config_dir / "keys.json"
+        keys_file.write_text(
+            json.dumps({"openai": {"api_key": token, "base_url": None, "model": None}}),
+            encoding="utf-8",
+        )
+
+        km = KeyManager(config_dir=temp_config_dir)
+
+        assert km.get_key("openai") == "sk-test123"
+        data = json.loads(keys_file.read_text(encoding="utf-8"))
+        assert data.get("_encrypted") is True
+        assert KeyManager(config_dir=temp_config_dir).get_key("openai") == "sk-test123"
+
+    def test_plaintext_encrypted_alongside_stray_token(
+        self, temp_config_dir: Path
+    ) -> None:
+        """Test that a stray token doesn't keep plain-text keys unencrypted."""
+        token = CryptoManager(temp_config_dir).encrypt("sk-test123")
+        keys_file = temp_config_dir / "keys.json"
+        keys_file.write_text(
+            json.dumps({"anthropic": "sk-ant-plain", "openai": token}),
+            encoding="utf-8",
+        )
+
+        km = KeyManager(config_dir=temp_config_dir)
+
+        assert km.get_key("anthropic") == "sk-ant-plain"
+        assert km.get_key("openai") == "sk-test123"
+        data = json.loads(keys_file.read_text(encoding="utf-8"))
+        assert data.get("_encrypted") is True
+        assert data["anthropic"]["api_key"] != "sk-ant-plain"
+        assert data["anthropic"]["api_key"].startswith("gAAAAA")
+
+    def test_undecryptable_stray_token_left_on_disk(
+        self,
+        temp_config_dir: Path,
+        tmp_path: Path,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that a token from another machine is skipped, not rewritten."""
+        token = CryptoManager(tmp_path / "other").encrypt("sk-test123")
+        keys_file = temp_config_dir / "keys.json"
+        keys_file.write_text(
+            json.dumps({"anthropic": "sk-ant-plain", "openai": token}),
+            encoding="utf-8",
+        )
+        original = keys_file.read_bytes()
+
+        km = KeyManager(config_dir=temp_config_dir)
+        masked = km.list_keys()
+
+        assert km.get_key("anthropic") == "sk-ant-plain"
+        assert "anthropic" in masked
+        assert "openai" in caplog.text
+        assert keys_file.read_bytes() == original
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Error Handling Tests
@@ -426,6 +736,14 @@ class TestBackwardCompatibility:
 class TestErrorHandling:
     """Tests for error handling scenarios."""
 
+    def test_empty_keys_file(self, temp_config_dir: Path) -> None:
+        """Test that an empty keys file is treated as no stored keys."""
+        (temp_config_dir / "keys.json").write_bytes(b"")
+
+        km = KeyManager(config_dir=temp_config_dir)
+
+        assert km.list_providers() == []
+
     def test_corrupted_json_file(self, temp_config_dir: Path) -> None:
         """Test handling of corrupted JSON file."""
         # Create corrupted keys file in the correct location (config_dir/keys.json)
@@ -710,3 +1028,176 @@ class TestBackwardCompatibilityMigration:
         assert "anthropic" in keys
         assert keys["openai"] == "sk-...123"
         assert keys["anthropic"] == "sk-...789"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Keys Cache Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestKeysCache:
+    """Tests for the in-memory keys cache."""
+
+    def test_repeated_reads_skip_decryption(
+        self, key_manager: KeyManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that reads after a save are served from the cache."""
+        key_manager.store_key("openai", "sk-proj-abc123")
+
+        def fail_decrypt(ciphertext: str) -> str:
+            raise AssertionError("decrypt should not be called on a cache hit")
+
+        monkeypatch.setattr(key_manager._crypto_manager, "decrypt", fail_decrypt)
+
+        assert key_manager.get_key("openai") == "sk-proj-abc123"
+        assert key_manager.key_exists("openai")
+        assert key_manager.list_keys() == {"openai": "sk-...123"}
+
+    def test_external_write_invalidates_cache(self, temp_config_dir: Path) -> None:
+        """Test that changes written by another instance are picked up."""
+        km1 = KeyManager(config_dir=temp_config_dir)
+        km1.store_key("openai", "sk-proj-abc123")
+
+        km2 = KeyManager(config_dir=temp_config_dir)
+        km2.store_key("anthropic", "sk-ant-xyz789")
+
+        assert km1.get_key("anthropic") == "sk-ant-xyz789"
+
+    def test_deleted_file_clears_cache(self, key_manager: KeyManager) -> None:
+        """Test that removing the keys file empties the store."""
+        key_manager.store_key("openai", "sk-proj-abc123")
+        key_manager.keys_file.unlink()
+
+        assert key_manager.list_providers() == []
+
+    def test_returned_dict_does_not_alias_cache(self, key_manager: KeyManager) -> None:
+        """Test that mutating a loaded dict does not corrupt the cache."""
+        key_manager.store_key("openai", "sk-proj-abc123")
+
+        keys = key_manager._load_keys()
+        keys["openai"]["api_key"] = "sk-mutated"
+        keys.clear()
+
+        assert key_manager.list_providers() == ["openai"]
+        assert key_manager.get_key("openai") == "sk-proj-abc123"
+
+    def test_cached_view_is_read_only(self, key_manager: KeyManager) -> None:
+        """Test that the shared cached mapping cannot be mutated."""
+        key_manager.store_key("openai", "sk-proj-abc123")
+
+        with pytest.raises(TypeError):
+            key_manager._cached_keys()["anthropic"] = {"api_key": "x"}  # type: ignore[index]
+
+    def test_presence_checks_skip_decryption(
+        self, temp_config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that lookups not needing plaintext never decrypt."""
+        KeyManager(config_dir=temp_config_dir).store_key(
+            "openai", "sk-proj-abc123", model="gpt-4"
+        )
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.setenv("OLLAMA_HOST", "http://localhost:11434")
+
+        km = KeyManager(config_dir=temp_config_dir)
+
+        def fail_decrypt(ciphertext: str) -> str:
+            raise AssertionError("decrypt should not be called")
+
+        monkeypatch.setattr(km._crypto_manager, "decrypt", fail_decrypt)
+
+        assert km.key_exists("openai")
+        assert not km.key_exists("anthropic")
+        assert km.list_providers() == ["openai"]
+        assert km.any_keys_configured()
+        assert km.get_model("openai") == "gpt-4"
+        assert km.get_key("ollama") == "http://localhost:11434"
+
+    def test_negative_cache_tracks_missing_providers(
+        self, key_manager: KeyManager
+    ) -> None:
+        """Test that providers without stored config are remembered as missing."""
+        key_manager.store_key("openai", "sk-proj-abc123")
+
+        assert "openai" not in key_manager._negative
+        assert {"anthropic", "ollama"} <= key_manager._negative
+
+        key_manager.delete_key("openai")
+
+        assert "openai" in key_manager._negative
+
+    def test_negative_cache_still_checks_env(
+        self, key_manager: KeyManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a missing stored key still falls back to the environment."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        assert not key_manager.key_exists("openai")
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-env-key123")
+
+        assert key_manager.get_key("openai") == "sk-env-key123"
+        assert key_manager.key_exists("openai")
+
+    def test_config_dir_recreated_after_removal(self, key_manager: KeyManager) -> None:
+        """Test that saving recreates a config dir removed after first use."""
+        key_manager.store_key("openai", "sk-proj-abc123")
+        shutil.rmtree(key_manager.config_dir)
+
+        key_manager.store_key("anthropic", "sk-ant-xyz789")
+
+        assert key_manager.list_providers() == ["anthropic"]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Package Import Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestCorePackageImport:
+    """Tests for lazy attribute resolution on specify.core."""
+
+    def test_import_does_not_load_key_manager(
+        self, run_isolated: Callable[..., subprocess.CompletedProcess[str]]
+    ) -> None:
+        """Test that importing specify.core defers the key_manager import."""
+        code = (
+            "import sys\n"
+            "import specify.core\n"
+            "assert 'specify.core.key_manager' not in sys.modules\n"
+            "specify.core.KeyManager\n"
+            "assert 'specify.core.key_manager' in sys.modules\n"
+        )
+        run_isolated(code)
+
+    def test_env_lookup_does_not_load_cryptography(
+        self,
+        tmp_path: Path,
+        run_isolated: Callable[..., subprocess.CompletedProcess[str]],
+    ) -> None:
+        """Test that lookups without a keys file never import cryptography."""
+        code = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from specify.core import KeyManager\n"
+            "km = KeyManager(config_dir=Path(sys.argv[1]))\n"
+            "assert km.get_key('openai') == 'sk-env'\n"
+            "assert not km.key_exists('anthropic')\n"
+            "assert 'cryptography' not in sys.modules\n"
+        )
+        run_isolated(
+            code,
+            str(tmp_path),
+            env={**os.environ, "OPENAI_API_KEY": "sk-env", "ANTHROPIC_API_KEY": ""},
+        )
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown names raise AttributeError."""
+        import specify.core
+
+        with pytest.raises(AttributeError, match=r"'specify\.core' has no attribute"):
+            specify.core.DoesNotExist  # noqa: B018
+
+    def test_dir_lists_lazy_names(self) -> None:
+        """Test that dir() includes names that haven't been imported yet."""
+        import specify.core
+
+        assert "KeyManager" in dir(specify.core)
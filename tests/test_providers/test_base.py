@@ -451,6 +451,13 @@ class TestProviderFactory:
         with pytest.raises(ProviderConfigError, match="must be a subclass of BaseProvider"):
             factory.register("notaprovider", NotAProvider)
 
+    def test_factory_register_non_class_raises_error(self) -> None:
+        """Test that registering a non-class, such as an import path, raises error."""
+        factory = ProviderFactory()
+
+        with pytest.raises(ProviderConfigError, match="must be a subclass of BaseProvider"):
+            factory.register("notaclass", "specify.providers.ollama:OllamaProvider")
+
     def test_factory_create_returns_provider_instance(
         self, provider_config: ProviderConfig
     ) -> None:
@@ -517,6 +524,71 @@ class TestProviderFactory:
         assert factory.is_registered("TEST") is True
         assert factory.is_registered("Test") is True
 
+    def test_factory_unregister_removes_provider(self) -> None:
+        """Test that unregister removes a provider, case-insensitively."""
+        factory = ProviderFactory()
+        factory.register("test", MockProvider)
+        factory.unregister("TEST")
+
+        assert not factory.is_registered("test")
+
+    def test_factory_unregister_unregistered_raises_error(self) -> None:
+        """Test that unregistering an unknown provider raises error."""
+        factory = ProviderFactory()
+
+        with pytest.raises(ProviderConfigError, match="is not registered"):
+            factory.unregister("unregistered")
+
+    def test_factory_register_lazy_resolves_on_create(
+        self, provider_config: ProviderConfig
+    ) -> None:
+        """Test that a lazily registered provider is imported and memoized on create."""
+        factory = ProviderFactory()
+        factory.register_lazy("mock", "tests.test_providers.conftest:MockProvider")
+
+        assert factory.is_registered("mock")
+        assert factory.get_available_providers() == ["mock"]
+
+        provider = factory.create("MOCK", provider_config)
+
+        assert isinstance(provider, MockProvider)
+        assert factory._registry["mock"] is MockProvider
+
+    def test_factory_register_lazy_duplicate_raises_error(self) -> None:
+        """Test that lazily registering a duplicate provider raises error."""
+        factory = ProviderFactory()
+        factory.register("test", MockProvider)
+
+        with pytest.raises(ProviderConfigError, match="already registered"):
+            factory.register_lazy("test", "tests.test_providers.conftest:MockProvider")
+
+    def test_factory_register_lazy_malformed_path_raises_error(self) -> None:
+        """Test that an import path without ':attr' is rejected."""
+        factory = ProviderFactory()
+
+        with pytest.raises(ProviderConfigError, match="module:attr"):
+            factory.register_lazy("mock", "tests.test_providers.conftest.MockProvider")
+
+    def test_factory_register_lazy_unimportable_raises_error(
+        self, provider_config: ProviderConfig
+    ) -> None:
+        """Test that create reports a lazily registered path that cannot be loaded."""
+        factory = ProviderFactory()
+        factory.register_lazy("missing", "tests.test_providers.conftest:NoSuchProvider")
+
+        with pytest.raises(ProviderConfigError, match="Cannot load provider"):
+            factory.create("missing", provider_config)
+
+    def test_factory_register_lazy_non_base_provider_raises_error(
+        self, provider_config: ProviderConfig
+    ) -> None:
+        """Test that a lazily registered non-BaseProvider is rejected on create."""
+        factory = ProviderFactory()
+        factory.register_lazy("config", "specify.providers.base:ProviderConfig")
+
+        with pytest.raises(ProviderConfigError, match="must be a subclass of BaseProvider"):
+            factory.create("config", provider_config)
+
 
 class TestProviderFactorySingleton:
     """Tests for the default factory singleton."""
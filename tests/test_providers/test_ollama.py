@@ -207,6 +207,22 @@ class TestOllamaProviderStream:
         
         assert result == ["Hello ", "world", "!"]
 
+    @pytest.mark.asyncio
+    async def test_stream_skips_empty_chunks(self, ollama_config, mock_ollama_client):
+        """Test that chunks without content are not yielded."""
+        async def mock_stream():
+            yield {"message": {"content": "Hello"}}
+            yield {"message": {"content": ""}}
+            yield {"message": {"content": None}}
+            yield {"message": {"content": " world"}}
+
+        mock_ollama_client.chat.return_value = mock_stream()
+        provider = OllamaProvider(ollama_config)
+
+        result = [chunk async for chunk in provider.stream("Hello", "Be concise")]
+
+        assert result == ["Hello", " world"]
+
     @pytest.mark.asyncio
     async def test_stream_with_empty_rules(self, ollama_config, mock_ollama_client):
         """Test streaming with empty rules (no system message)."""
@@ -300,6 +316,28 @@ class TestOllamaProviderFactory:
         provider = factory.create("OLLAMA", ollama_config)
         assert isinstance(provider, OllamaProvider)
 
+    def test_package_import_defers_ollama_sdk(self, run_isolated):
+        """Test that specify.providers registers Ollama without importing it."""
+        code = (
+            "import sys\n"
+            "from specify.providers import get_default_factory\n"
+            "assert get_default_factory().is_registered('ollama')\n"
+            "assert 'ollama' not in sys.modules\n"
+            "assert 'specify.providers.ollama' not in sys.modules\n"
+            "from specify.providers import OllamaProvider\n"
+            "assert OllamaProvider.__module__ == 'specify.providers.ollama'\n"
+        )
+        run_isolated(code)
+
+    def test_package_unknown_attribute_raises(self):
+        """Test that unknown names on specify.providers name that package."""
+        import specify.providers
+
+        assert "OllamaProvider" in dir(specify.providers)
+        match = r"'specify\.providers' has no attribute"
+        with pytest.raises(AttributeError, match=match):
+            specify.providers.DoesNotExist  # noqa: B018
+
     def test_submodule_import_no_side_effects(self):
         """Test that importing ollama submodule directly does not register provider.
         